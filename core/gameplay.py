@@ -1,5 +1,6 @@
 """Core gameplay logic for Algorithm Arena."""
 import pygame
+import random
 import time as time_module
 from core.graph import Graph
 from core.node import Node
@@ -62,13 +63,13 @@ class PlayerEntity:
         """
         if not self.move_queue:
             # First node in queue - check adjacency to current position
-            if target_node in [n for n, _ in self.node.neighbors]:
+            if target_node in self.node.neighbor_set():
                 self.move_queue.append(target_node)
                 return True
         else:
             # Check adjacency to last node in queue
             last_node = self.move_queue[-1]
-            if target_node in [n for n, _ in last_node.neighbors]:
+            if target_node in last_node.neighbor_set():
                 self.move_queue.append(target_node)
                 return True
         return False
@@ -83,12 +84,12 @@ class PlayerEntity:
             # Keep current animation target, replace rest
             current_target = self.move_queue[0]
             self.move_queue = [current_target]
-            if target_node in [n for n, _ in current_target.neighbors]:
+            if target_node in current_target.neighbor_set():
                 self.move_queue.append(target_node)
         else:
             # Not animating, start fresh queue
             self.move_queue = []
-            if target_node in [n for n, _ in self.node.neighbors]:
+            if target_node in self.node.neighbor_set():
                 self.move_queue.append(target_node)
     
     def can_move_to(self, target_node: Node) -> bool:
@@ -105,9 +106,8 @@ class PlayerEntity:
             True if target is an adjacent neighbor
         """
         # Can always click adjacent nodes (for queue system)
-        for neighbor, _ in self.node.neighbors:
-            if neighbor == target_node:
-                return True
+        if target_node in self.node.neighbor_set():
+            return True
         
         # Also check if clicking on queued nodes
         if self.move_queue and target_node in self.move_queue:
@@ -214,6 +214,12 @@ class EnemyAI:
         self.move_delay = ENEMY_SPEEDS.get(algorithm, 500)
         self.stats = Stats()
         
+        # Movement rules, looked up once instead of on every move
+        # (unknown algorithm names raise KeyError)
+        self._pick = self._PICKERS[algorithm]
+        self._is_traversal = algorithm in ('BFS', 'DFS', 'UCS')  # Can backtrack
+        self._is_local_search = not self._is_traversal  # Greedy/A*: never revisit
+        
         # Animation properties
         self.visual_pos = start_node.pos  # Rendered position
         self.animating = False
@@ -232,7 +238,7 @@ class EnemyAI:
         self.backtracked_from: set[Node] = set()
         
         # CRITICAL FIX: Mark starting node as visited immediately for BFS/DFS/UCS
-        if algorithm in ['BFS', 'DFS', 'UCS']:
+        if self._is_traversal:
             start_node.visited = True
         
         # Track if enemy is stuck (no valid moves)
@@ -301,8 +307,7 @@ class EnemyAI:
             return None
         
         # Special logic for Greedy/A* when player was caught and moved
-        if self.caught_player and self.algorithm in ['Greedy (Local Min)', 'Greedy (Local Max)',
-                                                      'A* (Local Min)', 'A* (Local Max)']:
+        if self.caught_player and self._is_local_search:
             # Player moved away - decide whether to follow or abandon
             # Get all valid neighbors (unvisited)
             valid_neighbors = [n for n, _ in self.node.neighbors 
@@ -312,19 +317,9 @@ class EnemyAI:
                 self.stuck = True
                 return None
             
-            # Determine the "correct" neighbor based on algorithm
-            if self.algorithm == "Greedy (Local Min)":
-                correct_neighbor = min(valid_neighbors, key=lambda n: n.heuristic)
-            elif self.algorithm == "Greedy (Local Max)":
-                correct_neighbor = max(valid_neighbors, key=lambda n: n.heuristic)
-            elif self.algorithm == "A* (Local Min)":
-                correct_neighbor = min(valid_neighbors, 
-                                     key=lambda n: n.heuristic + n.path_cost)
-            elif self.algorithm == "A* (Local Max)":
-                correct_neighbor = max(valid_neighbors, 
-                                     key=lambda n: n.heuristic + n.path_cost)
-            else:
-                correct_neighbor = valid_neighbors[0]
+            # Determine the "correct" neighbor by the algorithm's min/max rule
+            # (no local min/max check - the enemy only decides whom to follow)
+            correct_neighbor = self._pick(self, valid_neighbors, stop_at_extremum=False)
             
             # Check if player is at the correct neighbor
             if player_node == correct_neighbor:
@@ -337,7 +332,7 @@ class EnemyAI:
                 return correct_neighbor
         
         # Get valid neighbors based on algorithm type
-        if self.algorithm in ['BFS', 'DFS', 'UCS']:
+        if self._is_traversal:
             # BFS/DFS/UCS: Prioritize unvisited nodes, but allow backtracking when stuck
             # First, try to find truly unvisited neighbors (not visited AND not in visited_leaves)
             unvisited_neighbors = [n for n, _ in self.node.neighbors 
@@ -385,76 +380,94 @@ class EnemyAI:
                 self.stuck_reason = "dead_end"
                 return None  # Player wins!
         
-        # PLATEAU/RIDGE DETECTION for Greedy/A*: Check if stuck at local min/max
-        # before selecting next move
-        if self.algorithm == "Greedy (Local Min)":
-            # Check if at local minimum: all neighbors have GREATER heuristic values
-            min_neighbor_h = min(n.heuristic for n in valid_neighbors)
-            if min_neighbor_h > self.node.heuristic:
-                # All neighbors have greater values - stuck at local minimum!
-                self.stuck = True
-                self.stuck_reason = "local_min"
-                return None
-            # Pick neighbor with LOWEST heuristic (greedy, no planning)
-            next_node = min(valid_neighbors, key=lambda n: n.heuristic)
-        
-        elif self.algorithm == "Greedy (Local Max)":
-            # Check if at local maximum: all neighbors have SMALLER heuristic values
-            max_neighbor_h = max(n.heuristic for n in valid_neighbors)
-            if max_neighbor_h < self.node.heuristic:
-                # All neighbors have smaller values - stuck at local maximum!
-                self.stuck = True
-                self.stuck_reason = "local_max"
-                return None
-            # Pick neighbor with HIGHEST heuristic (greedy, no planning)
-            next_node = max(valid_neighbors, key=lambda n: n.heuristic)
-        
-        elif self.algorithm == "UCS":
-            # Pick neighbor with LOWEST path cost (greedy, no planning)
-            next_node = min(valid_neighbors, key=lambda n: n.path_cost)
-        
-        elif self.algorithm == "A* (Local Min)":
-            # Check if at local minimum: all neighbors have GREATER f-cost values
-            min_neighbor_f = min(n.heuristic + n.path_cost for n in valid_neighbors)
-            current_f = self.node.heuristic + self.node.path_cost
-            if min_neighbor_f > current_f:
-                # All neighbors have greater f-costs - stuck at local minimum!
-                self.stuck = True
-                self.stuck_reason = "local_min"
-                return None
-            # Pick neighbor with LOWEST f-cost (h + g)
-            next_node = min(valid_neighbors, 
-                           key=lambda n: n.heuristic + n.path_cost)
-        
-        elif self.algorithm == "A* (Local Max)":
-            # Check if at local maximum: all neighbors have SMALLER f-cost values
-            max_neighbor_f = max(n.heuristic + n.path_cost for n in valid_neighbors)
-            current_f = self.node.heuristic + self.node.path_cost
-            if max_neighbor_f < current_f:
-                # All neighbors have smaller f-costs - stuck at local maximum!
-                self.stuck = True
-                self.stuck_reason = "local_max"
-                return None
-            # Pick neighbor with HIGHEST f-cost (h + g)
-            next_node = max(valid_neighbors, 
-                           key=lambda n: n.heuristic + n.path_cost)
+        # Pick the next node by this algorithm's rule (detects plateaus/ridges
+        # for Greedy/A* before moving)
+        return self._pick(self, valid_neighbors)
+    
+    def _mark_stuck(self, reason: str) -> None:
+        """Mark the enemy as stuck (player wins).
         
-        elif self.algorithm == "BFS":
-            # BFS: Pick first unvisited neighbor (queue-like behavior)
-            # If all neighbors visited, backtrack to first available
-            next_node = valid_neighbors[0]
+        Args:
+            reason: Why the enemy got stuck (see stuck_reason)
+        """
+        self.stuck = True
+        self.stuck_reason = reason
+    
+    def _pick_min_heuristic(self, neighbors: list[Node],
+                            stop_at_extremum: bool = True) -> Node | None:
+        """Greedy (Local Min): pick the neighbor with the LOWEST heuristic.
         
-        elif self.algorithm == "DFS":
-            # DFS: Pick last unvisited neighbor (stack-like behavior)
-            # If all neighbors visited, backtrack to last available
-            next_node = valid_neighbors[-1]
+        Stuck at a local minimum when every neighbor has a GREATER heuristic
+        (unless stop_at_extremum is False).
+        """
+        next_node = min(neighbors, key=lambda n: n.heuristic)
+        if stop_at_extremum and next_node.heuristic > self.node.heuristic:
+            self._mark_stuck("local_min")
+            return None
+        return next_node
+    
+    def _pick_max_heuristic(self, neighbors: list[Node],
+                            stop_at_extremum: bool = True) -> Node | None:
+        """Greedy (Local Max): pick the neighbor with the HIGHEST heuristic.
         
-        else:
-            # Default: pick first neighbor
-            next_node = valid_neighbors[0]
+        Stuck at a local maximum when every neighbor has a SMALLER heuristic
+        (unless stop_at_extremum is False).
+        """
+        next_node = max(neighbors, key=lambda n: n.heuristic)
+        if stop_at_extremum and next_node.heuristic < self.node.heuristic:
+            self._mark_stuck("local_max")
+            return None
+        return next_node
+    
+    def _pick_min_path_cost(self, neighbors: list[Node]) -> Node:
+        """UCS: pick the neighbor with the LOWEST path cost (no planning)."""
+        return min(neighbors, key=lambda n: n.path_cost)
+    
+    def _pick_min_f_cost(self, neighbors: list[Node],
+                         stop_at_extremum: bool = True) -> Node | None:
+        """A* (Local Min): pick the neighbor with the LOWEST f-cost (h + g).
+        
+        Stuck at a local minimum when every neighbor has a GREATER f-cost
+        (unless stop_at_extremum is False).
+        """
+        next_node = min(neighbors, key=lambda n: n.heuristic + n.path_cost)
+        if stop_at_extremum and next_node.heuristic + next_node.path_cost > self.node.heuristic + self.node.path_cost:
+            self._mark_stuck("local_min")
+            return None
+        return next_node
+    
+    def _pick_max_f_cost(self, neighbors: list[Node],
+                         stop_at_extremum: bool = True) -> Node | None:
+        """A* (Local Max): pick the neighbor with the HIGHEST f-cost (h + g).
         
+        Stuck at a local maximum when every neighbor has a SMALLER f-cost
+        (unless stop_at_extremum is False).
+        """
+        next_node = max(neighbors, key=lambda n: n.heuristic + n.path_cost)
+        if stop_at_extremum and next_node.heuristic + next_node.path_cost < self.node.heuristic + self.node.path_cost:
+            self._mark_stuck("local_max")
+            return None
         return next_node
     
+    def _pick_first(self, neighbors: list[Node]) -> Node:
+        """BFS: pick the first neighbor (queue-like behavior)."""
+        return neighbors[0]
+    
+    def _pick_last(self, neighbors: list[Node]) -> Node:
+        """DFS: pick the last neighbor (stack-like behavior)."""
+        return neighbors[-1]
+    
+    # Neighbor picker for each algorithm, called as picker(self, neighbors)
+    _PICKERS = {
+        'Greedy (Local Min)': _pick_min_heuristic,
+        'Greedy (Local Max)': _pick_max_heuristic,
+        'UCS': _pick_min_path_cost,
+        'A* (Local Min)': _pick_min_f_cost,
+        'A* (Local Max)': _pick_max_f_cost,
+        'BFS': _pick_first,
+        'DFS': _pick_last,
+    }
+    
     def recalculate_path(self, target_node: Node):
         """Legacy compatibility method - no-op for pure greedy movement.
         
@@ -496,7 +509,7 @@ class EnemyAI:
                 
                 # Mark current node as visited AFTER animation completes
                 # CRITICAL FIX: Update node.visited boolean immediately for BFS/DFS/UCS
-                if self.algorithm in ['BFS', 'DFS', 'UCS']:
+                if self._is_traversal:
                     # Set the visited boolean on the node itself (for tooltip display)
                     self.node.visited = True
                     # Track visited leaves (cannot revisit these)
@@ -504,8 +517,7 @@ class EnemyAI:
                         self.visited_leaves.add(self.node)
                 
                 # For Greedy/A*: mark all visited nodes
-                if self.algorithm in ['Greedy (Local Min)', 'Greedy (Local Max)', 
-                                     'A* (Local Min)', 'A* (Local Max)']:
+                if self._is_local_search:
                     self.visited_nodes.add(self.node)
         
         # If caught player and player hasn't moved, stay put
@@ -540,22 +552,21 @@ class EnemyAI:
 class GameSession:
     """Main game session managing gameplay."""
     
-    def __init__(self, algorithm: str):
+    def __init__(self, algorithm: str, sound_manager: SoundManager | None = None):
         """Initialize game session.
         
         Args:
             algorithm: Selected algorithm name
+            sound_manager: Sound manager of a previous session to reuse (loads a new one if None)
         """
         self.algorithm = algorithm
         self.graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, NUM_NODES, GRAPH_SEED)
         
-        # Initialize sound manager
-        self.sound_manager = SoundManager()
+        # Initialize sound manager (sound files are only loaded once across retries)
+        self.sound_manager = sound_manager or SoundManager()
         
         # Random spawn positions using timestamp seed
-        import random
-        import time as time_module_local
-        random.seed(int(time_module_local.time() * 1000))
+        random.seed(int(time_module.time() * 1000))
         
         nodes = list(self.graph.nodes)
         random.shuffle(nodes)
@@ -605,7 +616,7 @@ class GameSession:
         
         # Game state
         self.paused = False
-        self.start_time = time_module.time()
+        self.start_ticks = pygame.time.get_ticks()  # Same clock as update()'s current_time
         self.game_time = 0
         self.is_victory = False
         self.is_defeat = False
@@ -645,18 +656,25 @@ class GameSession:
         
         return False
     
-    def update(self, current_time: int, delta_time: float):
+    def update(self, current_time: int, delta_time: float) -> bool:
         """Update game state.
         
         Args:
             current_time: Current time in milliseconds
             delta_time: Time since last frame in seconds
+            
+        Returns:
+            True if anything visible changed (the frame needs repainting)
         """
         if self.paused:
-            return
+            return False
         
-        # Update game time
-        self.game_time = int(time_module.time() - self.start_time)
+        # Snapshot visible state to detect idle frames
+        previous_game_time = self.game_time
+        was_animating = self.player.animating or self.enemy.animating
+        
+        # Update game time from the frame timestamp (no extra clock read)
+        self.game_time = max(0, (current_time - self.start_ticks) // 1000)
         
         # Update player with algorithm parameter for queue system
         if self.player.update(current_time, delta_time, self.algorithm):
@@ -698,6 +716,10 @@ class GameSession:
                 self.is_defeat = True
                 # Stop BGM on defeat
                 self.sound_manager.stop_bgm()
+        
+        return (was_animating or self.player.animating or self.enemy.animating
+                or player_damaged or self.game_time != previous_game_time
+                or self.is_victory or self.is_defeat)
     
     def toggle_pause(self):
         """Toggle pause state."""
@@ -1,12 +1,17 @@
 """Graph generation for Algorithm Arena."""
 import random
+from collections import deque
 import math
+import numpy as np
 from core.node import Node
 
 
 class Graph:
     """Manages the game's node network."""
     
+    # Cell size (pixels) of the spatial hash used for position lookups
+    BUCKET_SIZE = 60
+    
     def __init__(self, width: int, height: int, num_nodes: int = 28, seed: int = 42):
         """Generate a beautiful interconnected graph.
         
@@ -20,10 +25,23 @@ class Graph:
         self.height = height
         self.nodes: list[Node] = []
         
+        # Spatial hash: bucket -> node indices (built lazily)
+        self._buckets: dict[tuple[int, int], list[int]] = {}
+        self._bucketed_count = 0
+        
+        # Node positions as an (N, 2) float32 array, in graph order
+        self.node_positions = np.empty((0, 2), dtype=np.float32)
+        
+        # Last position lookup ((pos, radius), node), shared by hover and click
+        self._last_lookup = None
+        
         random.seed(seed)
         self._generate_nodes(num_nodes)
         self._connect_nodes()
         
+        # Each undirected edge once as (node, neighbor, weight), in graph order
+        self.edges = self._collect_edges()
+        
         # Assign RANDOM STATIC values to all nodes
         self._assign_random_costs()
     
@@ -167,6 +185,17 @@ class Graph:
         # Store dead-end info for debugging/verification
         self.dead_end_count = num_dead_ends
     
+    def _collect_edges(self) -> list[tuple[Node, Node, float]]:
+        """List every edge once, in the order nodes and neighbors are stored."""
+        edges = []
+        seen = set()
+        for node in self.nodes:
+            for neighbor, weight in node.neighbors:
+                if neighbor not in seen:
+                    edges.append((node, neighbor, weight))
+            seen.add(node)
+        return edges
+    
     def _ensure_connected(self):
         """Ensure all nodes are reachable from any node."""
         if not self.nodes:
@@ -174,11 +203,11 @@ class Graph:
         
         # BFS to find connected component
         visited = set()
-        queue = [self.nodes[0]]
+        queue = deque([self.nodes[0]])
         visited.add(self.nodes[0])
         
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             for neighbor, _ in current.neighbors:
                 if neighbor not in visited:
                     visited.add(neighbor)
@@ -253,17 +282,15 @@ class Graph:
             algorithm: Algorithm name
             favor_enemy_chance: Probability of creating enemy-favorable pattern (default 0.5)
         """
-        import random as rand_module
-        
         # CRITICAL: For Greedy/A*, ALWAYS create valid initial path (not random)
         # Find shortest path from enemy to player using BFS
         visited = set()
         parent_map = {enemy_node: None}
-        queue = [enemy_node]
+        queue = deque([enemy_node])
         visited.add(enemy_node)
         
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             if current == player_node:
                 break
             for neighbor, _ in current.neighbors:
@@ -280,6 +307,7 @@ class Graph:
                 path_to_player.append(node)
                 node = parent_map.get(node)
             path_to_player.reverse()
+        on_path = set(path_to_player)
         
         # Assign values based on algorithm type
         if 'Local Min' in algorithm:
@@ -301,12 +329,12 @@ class Graph:
                 
                 # Other nodes get random values but ensure they don't break the path
                 for node in self.nodes:
-                    if node not in path_to_player:
-                        node.heuristic = rand_module.uniform(50.0, 350.0)
+                    if node not in on_path:
+                        node.heuristic = random.uniform(50.0, 350.0)
             else:
                 # Fallback to random
                 for node in self.nodes:
-                    node.heuristic = rand_module.uniform(10.0, 300.0)
+                    node.heuristic = random.uniform(10.0, 300.0)
         
         elif 'Local Max' in algorithm:
             # For Local Max: create ascending path (low→high toward player)
@@ -327,26 +355,26 @@ class Graph:
                 
                 # Other nodes get random values but ensure they don't break the path
                 for node in self.nodes:
-                    if node not in path_to_player:
-                        node.heuristic = rand_module.uniform(10.0, 300.0)
+                    if node not in on_path:
+                        node.heuristic = random.uniform(10.0, 300.0)
             else:
                 # Fallback to random
                 for node in self.nodes:
-                    node.heuristic = rand_module.uniform(10.0, 300.0)
+                    node.heuristic = random.uniform(10.0, 300.0)
         
         elif algorithm == 'UCS':
             # For UCS: create low path_cost along path
             if path_to_player:
                 for node in path_to_player:
-                    node.path_cost = rand_module.uniform(10.0, 80.0)
+                    node.path_cost = random.uniform(10.0, 80.0)
                 # Other nodes get higher costs
                 for node in self.nodes:
-                    if node not in path_to_player:
-                        node.path_cost = rand_module.uniform(100.0, 300.0)
+                    if node not in on_path:
+                        node.path_cost = random.uniform(100.0, 300.0)
             else:
                 # Fallback to random
                 for node in self.nodes:
-                    node.path_cost = rand_module.uniform(10.0, 300.0)
+                    node.path_cost = random.uniform(10.0, 300.0)
         
         # For A* algorithms, also ensure valid gradient in path_cost
         if 'A*' in algorithm:
@@ -378,7 +406,7 @@ class Graph:
         # For all algorithms, assign path_cost to nodes not in path
         for node in self.nodes:
             if not hasattr(node, 'path_cost') or node.path_cost == 0.0:
-                node.path_cost = rand_module.uniform(10.0, 300.0)
+                node.path_cost = random.uniform(10.0, 300.0)
         
         # Round to 1 decimal place for cleaner display
         for node in self.nodes:
@@ -389,6 +417,8 @@ class Graph:
         """Update all nodes' h_cost to reflect distance to target.
         
         This is called when the player moves to update tooltip displays.
+        Distances come from the pre-calculated heuristic table, so no square
+        roots are taken here.
         
         Args:
             target_node: The target node (usually player's current position)
@@ -397,7 +427,7 @@ class Graph:
             if node == target_node:
                 node.h_cost = 0.0
             else:
-                node.h_cost = node.distance_to(target_node)
+                node.h_cost = node.get_heuristic_to(target_node)
     
     def get_node_by_label(self, label: str) -> Node | None:
         """Find node by its label."""
@@ -406,16 +436,65 @@ class Graph:
                 return node
         return None
     
+    def _build_spatial_index(self):
+        """Bucket node indices by position for fast position lookups."""
+        self.node_positions = np.array([node.pos for node in self.nodes],
+                                       dtype=np.float32).reshape(-1, 2)
+        keys = np.floor_divide(self.node_positions, self.BUCKET_SIZE).astype(np.int64)
+        
+        buckets = {}
+        for idx, (bx, by) in enumerate(keys.tolist()):
+            buckets.setdefault((bx, by), []).append(idx)
+        self._buckets = buckets
+        self._bucketed_count = len(self.nodes)
+        self._last_lookup = None
+    
     def get_node_at_pos(self, pos: tuple[float, float], radius: float = 30) -> Node | None:
-        """Find node at given position (within radius)."""
+        """Find node at given position (within radius).
+        
+        Only nodes in spatial hash buckets overlapping the search radius are
+        checked. If several nodes are in range, the first in graph order wins.
+        A repeated lookup at the same position reuses the previous result.
+        """
+        if self._bucketed_count != len(self.nodes):
+            self._build_spatial_index()
+        
+        # Hover and click at the same spot resolve to the same node
+        key = (tuple(pos), radius)
+        if self._last_lookup is not None and self._last_lookup[0] == key:
+            return self._last_lookup[1]
+        node = self._find_node_at_pos(pos, radius)
+        self._last_lookup = (key, node)
+        return node
+    
+    def _find_node_at_pos(self, pos: tuple[float, float], radius: float) -> Node | None:
+        """Search the spatial index for the first node within radius of pos."""
         x, y = pos
-        for node in self.nodes:
-            dx = node.pos[0] - x
-            dy = node.pos[1] - y
-            dist = math.sqrt(dx * dx + dy * dy)
-            if dist <= radius:
-                return node
-        return None
+        size = self.BUCKET_SIZE
+        radius_sq = radius * radius
+        min_bx, max_bx = int((x - radius) // size), int((x + radius) // size)
+        min_by, max_by = int((y - radius) // size), int((y + radius) // size)
+        
+        # Large radius: one vectorized pass beats walking many buckets
+        if (max_bx - min_bx + 1) * (max_by - min_by + 1) > len(self.nodes):
+            offsets = self.node_positions - np.array(pos, dtype=np.float32)
+            dist_sq = np.einsum('ij,ij->i', offsets, offsets)
+            hits = np.flatnonzero(dist_sq <= radius_sq)
+            return self.nodes[int(hits[0])] if hits.size else None
+        
+        best_idx = None
+        for bx in range(min_bx, max_bx + 1):
+            for by in range(min_by, max_by + 1):
+                for idx in self._buckets.get((bx, by), ()):
+                    if best_idx is not None and idx > best_idx:
+                        continue
+                    node = self.nodes[idx]
+                    dx = node.pos[0] - x
+                    dy = node.pos[1] - y
+                    if dx * dx + dy * dy <= radius_sq:
+                        best_idx = idx
+        
+        return self.nodes[best_idx] if best_idx is not None else None
     
     def reset_all_nodes(self):
         """Reset pathfinding metadata for all nodes."""
@@ -1,11 +1,73 @@
 """Graphics rendering for Algorithm Arena."""
 import pygame
 import math
+import string
+from functools import lru_cache
 from config import *
 from core.node import Node
 from core.models import Stats
 
 
+class GlyphAtlas:
+    """Pre-rendered glyphs for drawing short, frequently changing strings.
+    
+    Text is assembled from cached per-character surfaces instead of calling
+    font.render for every string on every frame. Kerning is ignored, which is
+    not noticeable for the short labels this is used for.
+    """
+    
+    PRELOADED = string.ascii_letters + string.digits + string.punctuation + ' '
+    
+    def __init__(self, font: pygame.font.Font, color: tuple[int, int, int]):
+        """Render the glyph set for a font and color.
+        
+        Args:
+            font: Font used to render glyphs
+            color: Text color
+        """
+        self.font = font
+        self.color = color
+        self.glyphs: dict[str, pygame.Surface] = {}
+        self.advances: dict[str, int] = {}
+        
+        for char in self.PRELOADED:
+            self._load(char)
+    
+    def _load(self, char: str):
+        """Render and cache a single glyph."""
+        self.glyphs[char] = self.font.render(char, True, self.color)
+        self.advances[char] = self.font.size(char)[0]
+    
+    def width(self, text: str) -> int:
+        """Get rendered width of text in pixels."""
+        advances = self.advances
+        width = 0
+        for char in text:
+            if char not in advances:
+                self._load(char)
+            width += advances[char]
+        return width
+    
+    def draw_text(self, surface: pygame.Surface, text: str, pos: tuple[int, int]):
+        """Draw text onto a surface using cached glyphs.
+        
+        Args:
+            surface: Surface to draw on
+            text: Text to draw
+            pos: Top-left position (x, y)
+        """
+        x, y = pos
+        glyphs = self.glyphs
+        advances = self.advances
+        blit_list = []
+        for char in text:
+            if char not in glyphs:
+                self._load(char)
+            blit_list.append((glyphs[char], (x, y)))
+            x += advances[char]
+        surface.blits(blit_list, doreturn=0)
+
+
 class GraphRenderer:
     """Renders the graph-based game world."""
     
@@ -32,19 +94,122 @@ class GraphRenderer:
             self.ui_font = pygame.font.SysFont('Arial', 17)
             self.large_font = pygame.font.SysFont('Arial', 22, bold=True)
         
+        # End screen and queue fonts (created once, not per frame)
+        self.title_font = pygame.font.SysFont('Arial', 32, bold=True)
+        self.section_font = pygame.font.SysFont('Arial', 18, bold=True)
+        try:
+            self.number_font = pygame.font.SysFont('Arial', 14, bold=True)
+        except:
+            self.number_font = self.font
+        
+        # Glyph atlases for text that changes while playing
+        self.tooltip_glyphs = GlyphAtlas(self.ui_font, TOOLTIP_TEXT)
+        self.hud_glyphs = GlyphAtlas(self.ui_font, self.theme['text'])
+        
         # Tooltip
         self.tooltip_node = None
         self.tooltip_pos = None
+        
+        # Pre-rendered fixed surfaces (HUD text and panel, node labels, edge weights,
+        # health bars per HP value)
+        self._label_cache: dict[tuple, pygame.Surface] = {}
+        
+        # Background, edges and nodes, keyed by (enemy path, visited flags)
+        self._world_layer: pygame.Surface | None = None
+        self._world_key = None
+        
+        # Lines of the last tooltip, keyed by (node, visited)
+        self._tooltip_key = None
+        self._tooltip_lines: tuple[str, ...] = ()
+        
+        # Composed tooltip surfaces keyed by their lines (contents rarely change)
+        self._compose_tooltip = lru_cache(maxsize=128)(self._render_tooltip)
+        
+        # Screen areas touched by dynamic elements in the current frame
+        self.dirty_rects: list[pygame.Rect] = []
+    
+    def reset(self, algorithm: str):
+        """Prepare the renderer for a new session, keeping fonts and cached surfaces.
+        
+        Args:
+            algorithm: Algorithm name of the new session
+        """
+        if algorithm != self.algorithm:
+            self.set_theme(algorithm)
+        self.tooltip_node = None
+        self.tooltip_pos = None
+        self._tooltip_key = None
+        self._world_key = None
+        self.dirty_rects = []
     
     def set_theme(self, algorithm: str):
         """Change visual theme based on algorithm."""
         self.algorithm = algorithm
         self.theme = THEMES.get(algorithm, THEMES['BFS'])
+        self.hud_glyphs = GlyphAtlas(self.ui_font, self.theme['text'])
+        self._tooltip_key = None
+        self._world_key = None
+    
+    def _label(self, text: str, font: pygame.font.Font, color: tuple[int, int, int]) -> pygame.Surface:
+        """Get a rendered label, rendering it only the first time it is used.
+        
+        Args:
+            text: Label text
+            font: Font to render with
+            color: Text color
+            
+        Returns:
+            Rendered text surface
+        """
+        key = (text, font, color)
+        surface = self._label_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._label_cache[key] = surface
+        return surface
     
     def draw_background(self):
-        """Draw themed background."""
+        """Draw themed background.
+        
+        Starts a new frame, so dirty rects from the previous frame are cleared.
+        """
+        self.dirty_rects = []
         self.screen.fill(self.theme['background'])
     
+    def _mark_dirty(self, rect: pygame.Rect) -> pygame.Rect:
+        """Record a screen area changed by a dynamic element this frame."""
+        self.dirty_rects.append(rect)
+        return rect
+    
+    def draw_world(self, graph, enemy_path: list[Node], player_entity, enemy_entity):
+        """Draw background, edges, nodes, player and enemy.
+        
+        Background, edges and node circles are kept in an off-screen layer
+        that is only re-rendered when the enemy path or a visited flag
+        changes; other frames blit it and draw the moving agents on top.
+        Starts a new frame, so dirty rects from the previous frame are cleared.
+        
+        Args:
+            graph: Graph object
+            enemy_path: List of nodes in enemy's current path (for highlighting)
+            player_entity: Player entity (has visual_pos)
+            enemy_entity: Enemy entity (has visual_pos)
+        """
+        self.dirty_rects = []
+        
+        key = (tuple(enemy_path or ()), tuple(node.visited for node in graph.nodes))
+        if self._world_layer is None or key != self._world_key:
+            if self._world_layer is None:
+                self._world_layer = pygame.Surface(self.screen.get_size()).convert(self.screen)
+            self._world_layer.fill(self.theme['background'])
+            self._draw_edge_lines(self._world_layer, graph, enemy_path)
+            self._draw_graph_nodes(self._world_layer, graph)
+            self._world_key = key
+        self.screen.blit(self._world_layer, (0, 0))
+        
+        self._mark_enemy_path(enemy_path)
+        self._draw_agents(player_entity, enemy_entity)
+    
     def draw_edges(self, graph, enemy_path: list[Node] = None):
         """Draw all edges in the graph.
         
@@ -52,6 +217,19 @@ class GraphRenderer:
             graph: Graph object
             enemy_path: List of nodes in enemy's current path (for highlighting)
         """
+        self._mark_enemy_path(enemy_path)
+        self._draw_edge_lines(self.screen, graph, enemy_path)
+    
+    def _mark_enemy_path(self, enemy_path: list[Node] | None):
+        """Mark the highlighted enemy path dirty (it changes as the enemy moves)."""
+        if enemy_path and len(enemy_path) > 1:
+            xs = [node.pos[0] for node in enemy_path]
+            ys = [node.pos[1] for node in enemy_path]
+            path_rect = pygame.Rect(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys))
+            self._mark_dirty(path_rect.inflate(ENEMY_PATH_WIDTH * 2, ENEMY_PATH_WIDTH * 2))
+    
+    def _draw_edge_lines(self, surface: pygame.Surface, graph, enemy_path: list[Node] | None):
+        """Draw edges and weight labels onto a surface."""
         # Build set of enemy path edges for quick lookup
         enemy_edges = set()
         if enemy_path and len(enemy_path) > 1:
@@ -60,40 +238,27 @@ class GraphRenderer:
                 enemy_edges.add((enemy_path[i], enemy_path[i + 1]))
                 enemy_edges.add((enemy_path[i + 1], enemy_path[i]))
         
-        # Draw all edges
-        drawn = set()
-        for node in graph.nodes:
-            for neighbor, weight in node.neighbors:
-                # Only draw each edge once
-                edge_id = (min(id(node), id(neighbor)), max(id(node), id(neighbor)))
-                if edge_id in drawn:
-                    continue
-                drawn.add(edge_id)
-                
-                # Check if this is part of enemy path
-                is_enemy_path = (node, neighbor) in enemy_edges
-                
-                # Choose color and width
-                if is_enemy_path:
-                    color = self.theme['enemy_path']
-                    width = ENEMY_PATH_WIDTH
-                else:
-                    color = self.theme['edge']
-                    width = EDGE_WIDTH
-                
-                # Draw line
-                pygame.draw.line(self.screen, color, node.pos, neighbor.pos, width)
-                
-                # Draw weight label at midpoint
-                if not is_enemy_path:  # Don't clutter enemy path
-                    mid_x = (node.pos[0] + neighbor.pos[0]) / 2
-                    mid_y = (node.pos[1] + neighbor.pos[1]) / 2
-                    weight_text = self.small_font.render(str(int(weight)), True, self.theme['text'])
-                    weight_rect = weight_text.get_rect(center=(mid_x, mid_y))
-                    # Draw background for readability
-                    bg_rect = weight_rect.inflate(4, 2)
-                    pygame.draw.rect(self.screen, self.theme['background'], bg_rect)
-                    self.screen.blit(weight_text, weight_rect)
+        # Draw all other edges with their weight labels
+        for node, neighbor, weight in graph.edges:
+            if (node, neighbor) in enemy_edges:
+                continue
+            
+            pygame.draw.line(surface, self.theme['edge'], node.pos, neighbor.pos, EDGE_WIDTH)
+            
+            # Draw weight label at midpoint
+            mid_x = (node.pos[0] + neighbor.pos[0]) / 2
+            mid_y = (node.pos[1] + neighbor.pos[1]) / 2
+            weight_text = self._label(str(int(weight)), self.small_font, self.theme['text'])
+            weight_rect = weight_text.get_rect(center=(mid_x, mid_y))
+            # Draw background for readability
+            bg_rect = weight_rect.inflate(4, 2)
+            pygame.draw.rect(surface, self.theme['background'], bg_rect)
+            surface.blit(weight_text, weight_rect)
+        
+        # Enemy path is one polyline on top (no weight labels to avoid clutter)
+        if enemy_edges:
+            pygame.draw.lines(surface, self.theme['enemy_path'], False,
+                              [node.pos for node in enemy_path], ENEMY_PATH_WIDTH)
     
     def draw_nodes(self, graph, player_entity, enemy_entity):
         """Draw all nodes in the graph.
@@ -103,6 +268,11 @@ class GraphRenderer:
             player_entity: Player entity (has visual_pos)
             enemy_entity: Enemy entity (has visual_pos)
         """
+        self._draw_graph_nodes(self.screen, graph)
+        self._draw_agents(player_entity, enemy_entity)
+    
+    def _draw_graph_nodes(self, surface: pygame.Surface, graph):
+        """Draw the node circles and labels onto a surface."""
         # Draw ALL nodes at their FIXED positions (never skip any node)
         for node in graph.nodes:
             # Determine node color
@@ -112,50 +282,84 @@ class GraphRenderer:
                 color = self.theme['node_default']
             
             # Draw node circle at FIXED position
-            pygame.draw.circle(self.screen, color, node.pos, NODE_RADIUS)
-            pygame.draw.circle(self.screen, self.theme['text'], node.pos, NODE_RADIUS, 2)
+            pygame.draw.circle(surface, color, node.pos, NODE_RADIUS)
+            pygame.draw.circle(surface, self.theme['text'], node.pos, NODE_RADIUS, 2)
             
             # Draw label at FIXED position
-            label_text = self.font.render(node.label, True, (0, 0, 0))
+            label_text = self._label(node.label, self.font, (0, 0, 0))
             label_rect = label_text.get_rect(center=node.pos)
-            self.screen.blit(label_text, label_rect)
+            surface.blit(label_text, label_rect)
+    
+    def _glow_layers(self, color: tuple[int, int, int]) -> list[tuple[int, pygame.Surface]]:
+        """Get the three translucent glow rings drawn under an agent.
+        
+        Args:
+            color: Agent color
+            
+        Returns:
+            List of (radius, surface) pairs, outermost first
+        """
+        key = ('glow', color)
+        layers = self._label_cache.get(key)
+        if layers is None:
+            layers = []
+            for i in range(3):
+                radius = NODE_RADIUS + (3 - i) * 5
+                alpha = 50 + i * 30
+                glow_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(glow_surface, (*color, alpha), (radius, radius), radius)
+                layers.append((radius, glow_surface))
+            self._label_cache[key] = layers
+        return layers
+    
+    def _draw_agents(self, player_entity, enemy_entity):
+        """Draw the player and enemy at their animated positions."""
+        # Player and enemy move every frame; mark their full glow area dirty
+        glow_radius = NODE_RADIUS + 15
         
         # Draw player with glow at visual position (OVER nodes)
         player_pos = tuple(int(p) for p in player_entity.visual_pos)
-        for i in range(3):
-            radius = NODE_RADIUS + (3 - i) * 5
-            alpha = 50 + i * 30
-            glow_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (*self.theme['player'], alpha), (radius, radius), radius)
-            self.screen.blit(glow_surface, (player_pos[0] - radius, player_pos[1] - radius))
+        self._mark_dirty(pygame.Rect(player_pos[0] - glow_radius, player_pos[1] - glow_radius,
+                                     glow_radius * 2, glow_radius * 2))
+        self.screen.blits([(glow_surface, (player_pos[0] - radius, player_pos[1] - radius))
+                           for radius, glow_surface in self._glow_layers(self.theme['player'])],
+                          doreturn=0)
         
         pygame.draw.circle(self.screen, self.theme['player'], player_pos, NODE_RADIUS)
         pygame.draw.circle(self.screen, self.theme['text'], player_pos, NODE_RADIUS, 2)
         
         # Draw player label at visual position (animated position)
-        label_text = self.font.render(player_entity.node.label, True, (0, 0, 0))
+        label_text = self._label(player_entity.node.label, self.font, (0, 0, 0))
         label_rect = label_text.get_rect(center=player_pos)
         self.screen.blit(label_text, label_rect)
         
         # Draw enemy with glow at visual position (OVER nodes)
         enemy_pos = tuple(int(p) for p in enemy_entity.visual_pos)
-        for i in range(3):
-            radius = NODE_RADIUS + (3 - i) * 5
-            alpha = 50 + i * 30
-            glow_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (*self.theme['enemy'], alpha), (radius, radius), radius)
-            self.screen.blit(glow_surface, (enemy_pos[0] - radius, enemy_pos[1] - radius))
+        self._mark_dirty(pygame.Rect(enemy_pos[0] - glow_radius, enemy_pos[1] - glow_radius,
+                                     glow_radius * 2, glow_radius * 2))
+        self.screen.blits([(glow_surface, (enemy_pos[0] - radius, enemy_pos[1] - radius))
+                           for radius, glow_surface in self._glow_layers(self.theme['enemy'])],
+                          doreturn=0)
         
         pygame.draw.circle(self.screen, self.theme['enemy'], enemy_pos, NODE_RADIUS)
         pygame.draw.circle(self.screen, self.theme['text'], enemy_pos, NODE_RADIUS, 2)
         
         # Draw enemy label at visual position (animated position)
-        label_text = self.font.render(enemy_entity.node.label, True, (0, 0, 0))
+        label_text = self._label(enemy_entity.node.label, self.font, (0, 0, 0))
         label_rect = label_text.get_rect(center=enemy_pos)
         self.screen.blit(label_text, label_rect)
     
+    def _end_overlay(self) -> pygame.Surface:
+        """Get the translucent overlay that dims the board behind end screens."""
+        overlay = self._label_cache.get('overlay')
+        if overlay is None:
+            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+            pygame.draw.rect(overlay, (0, 0, 0, 180), overlay.get_rect())
+            self._label_cache['overlay'] = overlay
+        return overlay
+    
     def draw_health_bars(self, player_entity, enemy_entity, 
-                        player_hp: float, enemy_hp: float):
+                        player_hp: float, enemy_hp: float) -> pygame.Rect:
         """Draw health bar above player only (enemy is invincible).
         
         Args:
@@ -163,50 +367,69 @@ class GraphRenderer:
             enemy_entity: Enemy entity (has visual_pos) - not used
             player_hp: Player health percentage (0.0 to 1.0)
             enemy_hp: Enemy health percentage (0.0 to 1.0) - not used
+            
+        Returns:
+            Screen area covered by the health bar
         """
         bar_width = 50
         bar_height = 6
         
-        # Only draw player health bar
+        # Only draw player health bar (pre-rendered per HP value)
         x = player_entity.visual_pos[0] - bar_width / 2
         y = player_entity.visual_pos[1] - NODE_RADIUS - 15
         
-        # Background
-        pygame.draw.rect(self.screen, (60, 60, 60), (x, y, bar_width, bar_height))
-        
-        # Health bar
-        hp_color = (100, 255, 100)
-        hp_width = bar_width * player_hp
-        pygame.draw.rect(self.screen, hp_color, (x, y, hp_width, bar_height))
+        key = ('health', player_hp)
+        bar = self._label_cache.get(key)
+        if bar is None:
+            bar = pygame.Surface((bar_width, bar_height)).convert(self.screen)
+            
+            # Background
+            bar.fill((60, 60, 60))
+            
+            # Health bar
+            hp_color = (100, 255, 100)
+            hp_width = bar_width * player_hp
+            pygame.draw.rect(bar, hp_color, (0, 0, hp_width, bar_height))
+            
+            # Border
+            pygame.draw.rect(bar, (200, 200, 200), (0, 0, bar_width, bar_height), 1)
+            self._label_cache[key] = bar
         
-        # Border
-        pygame.draw.rect(self.screen, (200, 200, 200), (x, y, bar_width, bar_height), 1)
+        return self._mark_dirty(self.screen.blit(bar, (x, y)))
     
-    def draw_ui_panel(self, stats: Stats, paused: bool, game_time: int):
+    def draw_ui_panel(self, stats: Stats, paused: bool, game_time: int) -> pygame.Rect:
         """Draw UI panel with game information.
         
         Args:
             stats: Pathfinding statistics (hidden during gameplay)
             paused: Whether game is paused
             game_time: Elapsed game time in seconds
+            
+        Returns:
+            Screen area covered by the panel
         """
         # Calculate text width dynamically for algorithm name
         algo_text_str = f'Algorithm: {self.algorithm}'
-        algo_text = self.large_font.render(algo_text_str, True, self.theme['ui_accent'])
+        algo_text = self._label(algo_text_str, self.large_font, self.theme['ui_accent'])
         text_width = algo_text.get_width()
         
         # Panel width: text width + padding (at least 400px)
         panel_width = max(400, text_width + 40)
         panel_height = 80
         
-        # Panel background
+        # Panel background (translucent, so it needs per-pixel alpha; built once)
         panel_rect = pygame.Rect(10, 10, panel_width, panel_height)
-        panel_surface = pygame.Surface((panel_rect.width, panel_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(panel_surface, (*self.theme['background'], 200), panel_surface.get_rect(), 
-                        border_radius=10)
-        pygame.draw.rect(panel_surface, self.theme['ui_accent'], panel_surface.get_rect(), 2,
-                        border_radius=10)
+        panel_key = ('panel', panel_rect.size, self.theme['background'], self.theme['ui_accent'])
+        panel_surface = self._label_cache.get(panel_key)
+        if panel_surface is None:
+            panel_surface = pygame.Surface(panel_rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(panel_surface, (*self.theme['background'], 200), panel_surface.get_rect(), 
+                            border_radius=10)
+            pygame.draw.rect(panel_surface, self.theme['ui_accent'], panel_surface.get_rect(), 2,
+                            border_radius=10)
+            self._label_cache[panel_key] = panel_surface
         self.screen.blit(panel_surface, panel_rect)
+        self._mark_dirty(panel_rect)
         
         # Algorithm name
         y = 20
@@ -216,22 +439,24 @@ class GraphRenderer:
         # Game time
         minutes = game_time // 60
         seconds = game_time % 60
-        time_text = self.ui_font.render(f'Time: {minutes:02d}:{seconds:02d}', True, self.theme['text'])
-        self.screen.blit(time_text, (20, y))
+        self.hud_glyphs.draw_text(self.screen, f'Time: {minutes:02d}:{seconds:02d}', (20, y))
         
         # Controls hint moved to bottom of screen
-        hint = self.small_font.render('SPACE: Pause  |  ESC: Menu  |  Hover: Node Info', 
-                                     True, self.theme['text'])
+        hint = self._label('SPACE: Pause  |  ESC: Menu  |  Hover: Node Info',
+                           self.small_font, self.theme['text'])
         self.screen.blit(hint, (10, WINDOW_HEIGHT - 25))
         
         # Pause indicator
         if paused:
-            pause_text = self.large_font.render('PAUSED', True, (255, 255, 100))
+            pause_text = self._label('PAUSED', self.large_font, (255, 255, 100))
             pause_rect = pause_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
             # Background
             bg_rect = pause_rect.inflate(40, 20)
             pygame.draw.rect(self.screen, (0, 0, 0, 180), bg_rect, border_radius=8)
             self.screen.blit(pause_text, pause_rect)
+            self._mark_dirty(bg_rect)
+        
+        return panel_rect
     
     def set_tooltip(self, node: Node | None, mouse_pos: tuple[int, int]):
         """Set tooltip for hovering over node.
@@ -243,13 +468,46 @@ class GraphRenderer:
         self.tooltip_node = node
         self.tooltip_pos = mouse_pos
     
-    def draw_tooltip(self):
-        """Draw tooltip if hovering over a node."""
+    def draw_tooltip(self) -> pygame.Rect | None:
+        """Draw tooltip if hovering over a node.
+        
+        Returns:
+            Screen area covered by the tooltip, or None if nothing was drawn
+        """
         if not self.tooltip_node or not self.tooltip_pos:
-            return
+            return None
         
+        # Lines only change when another node is hovered or its visited flag flips
         node = self.tooltip_node
+        key = (node, node.visited)
+        if key != self._tooltip_key:
+            self._tooltip_lines = self._build_tooltip_lines(node)
+            self._tooltip_key = key
+        
+        tooltip = self._compose_tooltip(self._tooltip_lines)
+        tooltip_width, tooltip_height = tooltip.get_size()
+        
+        # Position tooltip (offset from mouse, keep on screen)
+        x = self.tooltip_pos[0] + 15
+        y = self.tooltip_pos[1] + 15
+        
+        if x + tooltip_width > WINDOW_WIDTH:
+            x = self.tooltip_pos[0] - tooltip_width - 15
+        if y + tooltip_height > WINDOW_HEIGHT:
+            y = self.tooltip_pos[1] - tooltip_height - 15
+        
+        tooltip_rect = self.screen.blit(tooltip, (x, y))
+        return self._mark_dirty(tooltip_rect)
+    
+    def _build_tooltip_lines(self, node: Node) -> tuple[str, ...]:
+        """Build the tooltip text for a node.
         
+        Args:
+            node: Hovered node
+            
+        Returns:
+            Tooltip lines for the current algorithm
+        """
         # Build tooltip lines - ALWAYS show for every node
         lines = [f"Node {node.label}"]
         
@@ -280,35 +538,43 @@ class GraphRenderer:
             f_cost = node.heuristic + node.path_cost
             lines.append(f"f(n) = {f_cost:.1f}")
         
-        # Render tooltip
+        return tuple(lines)
+    
+    def _render_tooltip(self, lines: tuple[str, ...]) -> pygame.Surface:
+        """Render a complete tooltip box for the given lines.
+        
+        Args:
+            lines: Tooltip text lines
+            
+        Returns:
+            Surface with background, border and text
+        """
         padding = TOOLTIP_PADDING
         line_height = 18
         
         # Calculate size
-        max_width = max(self.ui_font.size(line)[0] for line in lines)
+        glyphs = self.tooltip_glyphs
+        max_width = max(glyphs.width(line) for line in lines)
         tooltip_width = max_width + padding * 2
         tooltip_height = len(lines) * line_height + padding * 2
         
-        # Position tooltip (offset from mouse, keep on screen)
-        x = self.tooltip_pos[0] + 15
-        y = self.tooltip_pos[1] + 15
-        
-        if x + tooltip_width > WINDOW_WIDTH:
-            x = self.tooltip_pos[0] - tooltip_width - 15
-        if y + tooltip_height > WINDOW_HEIGHT:
-            y = self.tooltip_pos[1] - tooltip_height - 15
-        
-        # Draw tooltip background
-        tooltip_rect = pygame.Rect(x, y, tooltip_width, tooltip_height)
-        pygame.draw.rect(self.screen, TOOLTIP_BG, tooltip_rect, border_radius=5)
-        pygame.draw.rect(self.screen, TOOLTIP_BORDER, tooltip_rect, 2, border_radius=5)
+        # Opaque surface in the screen's format; the corners outside the
+        # rounded border are masked with a colorkey instead of per-pixel alpha
+        colorkey = (255, 0, 255)
+        tooltip = pygame.Surface((tooltip_width, tooltip_height)).convert(self.screen)
+        tooltip.fill(colorkey)
+        tooltip.set_colorkey(colorkey, pygame.RLEACCEL)
+        tooltip_rect = tooltip.get_rect()
+        pygame.draw.rect(tooltip, TOOLTIP_BG, tooltip_rect, border_radius=5)
+        pygame.draw.rect(tooltip, TOOLTIP_BORDER, tooltip_rect, 2, border_radius=5)
         
         # Draw text
-        text_y = y + padding
+        text_y = padding
         for line in lines:
-            text = self.ui_font.render(line, True, TOOLTIP_TEXT)
-            self.screen.blit(text, (x + padding, text_y))
+            glyphs.draw_text(tooltip, line, (padding, text_y))
             text_y += line_height
+        
+        return tooltip
     
     def draw_victory_screen(self, player_stats: dict, enemy_stats: dict, game_time: int, victory_reason: str = ""):
         """Draw victory screen with statistics.
@@ -320,9 +586,7 @@ class GraphRenderer:
             victory_reason: Reason for victory ("enemy_stuck", "combat", or "")
         """
         # Semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.rect(overlay, (0, 0, 0, 180), overlay.get_rect())
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._end_overlay(), (0, 0))
         
         # Victory box
         box_width = 500
@@ -336,7 +600,7 @@ class GraphRenderer:
         
         # Title
         y = box_y + 30
-        title = pygame.font.SysFont('Arial', 32, bold=True).render('🎉 VICTORY! 🎉', True, (100, 255, 100))
+        title = self.title_font.render('🎉 VICTORY! 🎉', True, (100, 255, 100))
         title_rect = title.get_rect(centerx=WINDOW_WIDTH // 2)
         self.screen.blit(title, (title_rect.x, y))
         y += 50
@@ -391,9 +655,7 @@ class GraphRenderer:
             game_time: Game duration in seconds
         """
         # Semi-transparent overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.rect(overlay, (0, 0, 0, 180), overlay.get_rect())
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._end_overlay(), (0, 0))
         
         # Defeat box
         box_width = 500
@@ -407,7 +669,7 @@ class GraphRenderer:
         
         # Title
         y = box_y + 30
-        title = pygame.font.SysFont('Arial', 32, bold=True).render('💀 DEFEAT! 💀', True, (255, 100, 100))
+        title = self.title_font.render('💀 DEFEAT! 💀', True, (255, 100, 100))
         title_rect = title.get_rect(centerx=WINDOW_WIDTH // 2)
         self.screen.blit(title, (title_rect.x, y))
         y += 50
@@ -448,7 +710,7 @@ class GraphRenderer:
     def _draw_stat_section(self, title: str, x: int, y: int, stats: list[str]):
         """Helper to draw a section of statistics."""
         # Title
-        title_text = pygame.font.SysFont('Arial', 18, bold=True).render(title, True, (200, 200, 200))
+        title_text = self.section_font.render(title, True, (200, 200, 200))
         self.screen.blit(title_text, (x, y))
         y += 25
         
@@ -469,8 +731,6 @@ class GraphRenderer:
             color: Line color
             width: Line width
         """
-        import math
-        
         # Calculate dash parameters
         dash_length = 10
         gap_length = 5
@@ -509,15 +769,18 @@ class GraphRenderer:
             # Move to next dash
             current_distance += dash_length + gap_length
     
-    def draw_queued_path(self, screen, player):
+    def draw_queued_path(self, screen, player) -> pygame.Rect | None:
         """Draw dashed lines and numbers for queued moves.
         
         Args:
             screen: Pygame surface to draw on
             player: Player entity with move_queue
+            
+        Returns:
+            Bounding area of the queue visualization, or None if queue is empty
         """
         if not player.move_queue:
-            return
+            return None
         
         # Colors for queue visualization
         CYAN = (0, 255, 255)
@@ -538,11 +801,7 @@ class GraphRenderer:
             self.draw_dashed_line(screen, start, end, CYAN, 3)
         
         # Draw highlights and numbers on queued nodes
-        try:
-            number_font = pygame.font.SysFont('Arial', 14, bold=True)
-        except:
-            number_font = self.font
-        
+        number_font = self.number_font
         for i, node in enumerate(player.move_queue):
             if i == 0:
                 # First queued node - bright cyan circle (current target)
@@ -552,10 +811,17 @@ class GraphRenderer:
                 pygame.draw.circle(screen, LIGHT_CYAN, node.pos, NODE_RADIUS + 5, 2)
                 
                 # Draw number above node
-                label = number_font.render(str(i), True, WHITE)
+                label = self._label(str(i), number_font, WHITE)
                 label_rect = label.get_rect(center=(node.pos[0], node.pos[1] - NODE_RADIUS - 18))
                 # Draw background circle for number
                 bg_radius = 10
                 pygame.draw.circle(screen, (0, 0, 0, 180), label_rect.center, bg_radius)
                 pygame.draw.circle(screen, CYAN, label_rect.center, bg_radius, 2)
                 screen.blit(label, label_rect)
+        
+        # Bounding box of all queued nodes plus rings and number labels
+        xs = [player.visual_pos[0]] + [node.pos[0] for node in player.move_queue]
+        ys = [player.visual_pos[1]] + [node.pos[1] for node in player.move_queue]
+        queue_rect = pygame.Rect(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys))
+        margin = NODE_RADIUS + 30
+        return self._mark_dirty(queue_rect.inflate(margin * 2, margin * 2))
@@ -2,6 +2,10 @@
 import random
 from typing import Iterator
 
+# 4-way movement, then diagonals for 8-way
+DIRECTIONS_4 = ((0, -1), (1, 0), (0, 1), (-1, 0))
+DIRECTIONS_8 = DIRECTIONS_4 + ((-1, -1), (1, -1), (1, 1), (-1, 1))
+
 class Grid:
     """Represents the game grid with obstacles and navigation."""
     
@@ -41,18 +45,14 @@ class Grid:
     def neighbors(self, pos: tuple[int, int]) -> Iterator[tuple[int, int]]:
         """Yield valid neighboring positions."""
         x, y = pos
+        w, h, blocked = self.w, self.h, self.blocked
         
-        # 4-way movement
-        directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]
-        
-        # Add diagonals for 8-way
-        if self.eight_connected:
-            directions.extend([(-1, -1), (1, -1), (1, 1), (-1, 1)])
-        
+        # Bounds and passability are inlined; this runs for every expansion
+        directions = DIRECTIONS_8 if self.eight_connected else DIRECTIONS_4
         for dx, dy in directions:
-            next_pos = (x + dx, y + dy)
-            if self.in_bounds(next_pos) and self.passable(next_pos):
-                yield next_pos
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < w and 0 <= ny < h and not blocked[ny][nx]:
+                yield (nx, ny)
     
     def step_cost(self, from_pos: tuple[int, int], to_pos: tuple[int, int]) -> float:
         """Get the cost of moving from one position to another."""
@@ -3,6 +3,21 @@ import pygame
 from config import *
 
 
+# Transparent background of pre-rendered button faces
+FACE_COLORKEY = (255, 0, 255)
+
+
+def _draw_gradient(surface: pygame.Surface, width: int, height: int):
+    """Fill a surface with the menu gradient (dark blue to dark purple)."""
+    for y in range(height):
+        # Gradient from dark blue (15, 25, 45) to dark purple (35, 15, 55)
+        ratio = y / height
+        r = int(15 + (35 - 15) * ratio)
+        g = int(25 + (15 - 25) * ratio)
+        b = int(45 + (55 - 45) * ratio)
+        pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
+
+
 class Button:
     """Modern rounded button with gradient and hover effects."""
     
@@ -25,6 +40,14 @@ class Button:
         self.is_hovered = False
         self.is_pressed = False
         self.hover_scale = 1.0  # For smooth animations
+        
+        # Rendered label, reused until the text or font changes
+        self._label_text = None
+        self._label_font = None
+        self._label_surface = None
+        
+        # Rendered button faces keyed by (pressed, hovered, size)
+        self._faces: dict[tuple, pygame.Surface] = {}
     
     def handle_event(self, event) -> bool:
         """Handle mouse events.
@@ -50,8 +73,46 @@ class Button:
         
         return False
     
-    def draw(self, screen, font):
-        """Draw the button with modern effects."""
+    def draw(self, screen, font) -> pygame.Rect:
+        """Draw the button with modern effects.
+        
+        Returns:
+            Screen area covered by the button, its glow and shadow
+        """
+        # Button faces are pre-rendered per state; drawing is a single blit
+        face = self._get_face(screen, font)
+        return screen.blit(face, (self.rect.x - 2, self.rect.y - 2))
+    
+    @property
+    def visual_state(self) -> tuple[bool, bool]:
+        """Pressed and hovered flags, which decide how the button looks."""
+        return (self.is_pressed, self.is_hovered)
+    
+    def _get_face(self, screen, font) -> pygame.Surface:
+        """Get the rendered button for the current state, rendering it on first use."""
+        label = self._get_label(font)
+        key = (*self.visual_state, self.rect.size)
+        face = self._faces.get(key)
+        if face is None:
+            face = self._render_face(screen, label)
+            self._faces[key] = face
+        return face
+    
+    def _render_face(self, screen, label: pygame.Surface) -> pygame.Surface:
+        """Render shadow, body, border, glow and label for the current state.
+        
+        Args:
+            screen: Display surface (used for pixel format)
+            label: Rendered button text
+            
+        Returns:
+            Colorkeyed surface covering the button plus its glow and shadow
+        """
+        # Margin of 2px for the hover glow, plus 3px below for the shadow
+        face = pygame.Surface((self.rect.width + 4, self.rect.height + 5)).convert(screen)
+        face.fill(FACE_COLORKEY)
+        rect = pygame.Rect(2, 2, self.rect.width, self.rect.height)
+        
         # Choose color based on state
         color = self.bg_color
         if self.is_pressed:
@@ -60,34 +121,44 @@ class Button:
             color = self.hover_color
         
         # Draw shadow effect
-        shadow_rect = self.rect.copy()
+        shadow_rect = rect.copy()
         shadow_rect.y += 3
-        pygame.draw.rect(screen, (0, 0, 0, 50), shadow_rect, border_radius=15)
+        pygame.draw.rect(face, (0, 0, 0, 50), shadow_rect, border_radius=15)
         
         # Draw rounded rectangle with gradient effect
         # Create a slightly lighter color for gradient
         light_color = tuple(min(255, c + 20) for c in color)
         
         # Main button
-        pygame.draw.rect(screen, color, self.rect, border_radius=15)
+        pygame.draw.rect(face, color, rect, border_radius=15)
         
         # Highlight at top for 3D effect
-        highlight_rect = pygame.Rect(self.rect.x, self.rect.y, self.rect.width, self.rect.height // 3)
-        pygame.draw.rect(screen, light_color, highlight_rect, border_radius=15)
+        highlight_rect = pygame.Rect(rect.x, rect.y, rect.width, rect.height // 3)
+        pygame.draw.rect(face, light_color, highlight_rect, border_radius=15)
         
         # Border
         border_color = (200, 220, 255) if self.is_hovered else UI_BUTTON_TEXT
-        pygame.draw.rect(screen, border_color, self.rect, 2, border_radius=15)
+        pygame.draw.rect(face, border_color, rect, 2, border_radius=15)
         
         # Glow effect on hover
         if self.is_hovered:
-            glow_rect = self.rect.inflate(4, 4)
-            pygame.draw.rect(screen, (100, 150, 255, 128), glow_rect, 3, border_radius=15)
+            glow_rect = rect.inflate(4, 4)
+            pygame.draw.rect(face, (100, 150, 255, 128), glow_rect, 3, border_radius=15)
         
         # Draw text centered
-        text_surface = font.render(self.text, True, UI_BUTTON_TEXT)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        text_rect = label.get_rect(center=rect.center)
+        face.blit(label, text_rect)
+        face.set_colorkey(FACE_COLORKEY, pygame.RLEACCEL)
+        return face
+    
+    def _get_label(self, font) -> pygame.Surface:
+        """Get the rendered label, re-rendering only if text or font changed."""
+        if self.text != self._label_text or font is not self._label_font:
+            self._label_surface = font.render(self.text, True, UI_BUTTON_TEXT)
+            self._label_text = self.text
+            self._label_font = font
+            self._faces = {}
+        return self._label_surface
 
 
 class RadioButton:
@@ -111,6 +182,15 @@ class RadioButton:
         
         # Clickable area
         self.rect = pygame.Rect(x - 20, y - 20, 500, 40)
+        
+        # Rendered label, reused while the font stays the same
+        self._label_font = None
+        self._label_surface = None
+    
+    @property
+    def visual_state(self) -> tuple[bool, bool]:
+        """Hover and selected flags, which decide how the radio button looks."""
+        return (self.hover, self.selected)
     
     def handle_event(self, event) -> bool:
         """Handle mouse events.
@@ -137,8 +217,14 @@ class RadioButton:
             pygame.draw.circle(screen, color, (self.x, self.y), self.circle_radius - 6)
         
         # Text with larger font
-        text_surface = font.render(f"{self.text} - {self.description}", True, (230, 230, 230))
-        screen.blit(text_surface, (self.x + 25, self.y - 12))
+        screen.blit(self._get_label(font), (self.x + 25, self.y - 12))
+    
+    def _get_label(self, font) -> pygame.Surface:
+        """Get the rendered label, re-rendering only if the font changed."""
+        if font is not self._label_font:
+            self._label_surface = font.render(f"{self.text} - {self.description}", True, (230, 230, 230))
+            self._label_font = font
+        return self._label_surface
 
 
 class MainMenu:
@@ -180,6 +266,9 @@ class MainMenu:
         self.quit_button = Button(
             button_x, start_y + spacing * 2, button_width, button_height, 'QUIT'
         )
+        
+        # Pre-rendered background and title (built lazily on first draw)
+        self._page = None
     
     def handle_event(self, event) -> tuple[str, None]:
         """Handle input events.
@@ -201,16 +290,45 @@ class MainMenu:
         
         return ('', None)
     
-    def draw(self, screen):
-        """Draw the main menu."""
+    def visual_state(self) -> tuple:
+        """Get the widget states that decide how the screen looks."""
+        return (
+            self.tutorial_button.visual_state,
+            self.start_button.visual_state,
+            self.quit_button.visual_state
+        )
+    
+    def draw(self, screen) -> list[pygame.Rect]:
+        """Draw the main menu.
+        
+        Returns:
+            Screen areas of the buttons (the only parts that change between frames)
+        """
+        # Background and title never change; only the buttons are drawn live
+        if self._page is None:
+            self._page = self._render_page(screen)
+        screen.blit(self._page, (0, 0))
+        
+        # Draw buttons
+        return [
+            self.tutorial_button.draw(screen, self.font),
+            self.start_button.draw(screen, self.font),
+            self.quit_button.draw(screen, self.font)
+        ]
+    
+    def _render_page(self, screen) -> pygame.Surface:
+        """Render the gradient background and title into an off-screen surface.
+        
+        Args:
+            screen: Display surface (used for pixel format)
+            
+        Returns:
+            Surface holding the static part of the menu
+        """
+        page = pygame.Surface((self.screen_width, self.screen_height)).convert(screen)
+        
         # Modern gradient background (dark blue to purple)
-        for y in range(self.screen_height):
-            # Gradient from dark blue (15, 25, 45) to dark purple (35, 15, 55)
-            ratio = y / self.screen_height
-            r = int(15 + (35 - 15) * ratio)
-            g = int(25 + (15 - 25) * ratio)
-            b = int(45 + (55 - 45) * ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (self.screen_width, y))
+        _draw_gradient(page, self.screen_width, self.screen_height)
         
         # Title centered at top
         title = self.title_font.render('ALGORITHM ARENA', True, (255, 255, 255))
@@ -219,13 +337,9 @@ class MainMenu:
         # Glow effect for title
         glow = self.title_font.render('ALGORITHM ARENA', True, (100, 150, 255))
         glow_rect = glow.get_rect(center=(self.screen_width // 2 + 2, 122))
-        screen.blit(glow, glow_rect)
-        screen.blit(title, title_rect)
-        
-        # Draw buttons
-        self.tutorial_button.draw(screen, self.font)
-        self.start_button.draw(screen, self.font)
-        self.quit_button.draw(screen, self.font)
+        page.blit(glow, glow_rect)
+        page.blit(title, title_rect)
+        return page
 
 
 class TutorialScreen:
@@ -260,6 +374,9 @@ class TutorialScreen:
             button_width, button_height,
             'BACK TO MENU'
         )
+        
+        # Pre-rendered page (built lazily on first draw)
+        self._page = None
     
     def handle_event(self, event) -> bool:
         """Handle input events.
@@ -269,23 +386,51 @@ class TutorialScreen:
         """
         return self.back_button.handle_event(event)
     
-    def draw(self, screen):
-        """Draw the tutorial screen."""
-        screen.fill((20, 20, 30))
+    def visual_state(self) -> tuple:
+        """Get the widget states that decide how the screen looks."""
+        return (self.back_button.visual_state,)
+    
+    def draw(self, screen) -> list[pygame.Rect]:
+        """Draw the tutorial screen.
+        
+        Returns:
+            Screen area of the back button (the only part that changes between frames)
+        """
+        # Static page is rendered once; only the back button is drawn live
+        if self._page is None:
+            self._page = self._render_page(screen)
+        screen.blit(self._page, (0, 0))
+        
+        # Back button
+        return [self.back_button.draw(screen, self.font)]
+    
+    def _render_page(self, screen) -> pygame.Surface:
+        """Render the static instruction text into an off-screen surface.
+        
+        Args:
+            screen: Display surface (used for pixel format)
+            
+        Returns:
+            Surface holding the fully rendered page
+        """
+        page = pygame.Surface((self.screen_width, self.screen_height)).convert(screen)
+        page.fill((20, 20, 30))
         
         # Title
         title = self.title_font.render('HOW TO PLAY - ALGORITHM ARENA', True, (255, 255, 255))
         title_rect = title.get_rect(center=(self.screen_width // 2, 40))
-        screen.blit(title, title_rect)
+        
+        # Lines are collected and blitted in one batch at the end
+        blit_list = [(title, title_rect)]
         
         y = 90
         line_spacing = 25
         section_spacing = 35
         
-        # Helper to draw text
+        # Helper to queue text
         def draw_text(text, font, y_pos, indent=0):
             rendered = font.render(text, True, (220, 220, 220))
-            screen.blit(rendered, (60 + indent, y_pos))
+            blit_list.append((rendered, (60 + indent, y_pos)))
             return y_pos + line_spacing
         
         # Objective
@@ -315,8 +460,8 @@ class TutorialScreen:
         y = draw_text('• Enemy recalculates when you move', self.font, y, 20)
         y = draw_text('• Use pause to examine the graph', self.font, y, 20)
         
-        # Back button
-        self.back_button.draw(screen, self.font)
+        page.blits(blit_list, doreturn=0)
+        return page
 
 
 class AlgorithmSelectionScreen:
@@ -376,6 +521,12 @@ class AlgorithmSelectionScreen:
             button_width, button_height,
             'CONTINUE'
         )
+        
+        # Pre-rendered background and title (built lazily on first draw)
+        self._page = None
+        
+        # Label of the grayed-out CONTINUE button (rendered on first draw)
+        self._disabled_label = None
     
     def handle_event(self, event) -> tuple[str, str | None]:
         """Handle input events.
@@ -403,25 +554,20 @@ class AlgorithmSelectionScreen:
         
         return ('', None)
     
+    def visual_state(self) -> tuple:
+        """Get the widget states that decide how the screen looks."""
+        return (
+            self.back_button.visual_state,
+            self.continue_button.visual_state,
+            tuple(radio.visual_state for radio in self.radio_buttons)
+        )
+    
     def draw(self, screen):
         """Draw the algorithm selection screen."""
-        # Modern gradient background (dark blue to purple)
-        for y in range(self.screen_height):
-            ratio = y / self.screen_height
-            r = int(15 + (35 - 15) * ratio)
-            g = int(25 + (15 - 25) * ratio)
-            b = int(45 + (55 - 45) * ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (self.screen_width, y))
-        
-        # Title
-        title = self.title_font.render('SELECT ALGORITHM', True, (255, 255, 255))
-        title_rect = title.get_rect(center=(self.screen_width // 2, 80))
-        
-        # Glow effect for title
-        glow = self.title_font.render('SELECT ALGORITHM', True, (100, 150, 255))
-        glow_rect = glow.get_rect(center=(self.screen_width // 2 + 2, 82))
-        screen.blit(glow, glow_rect)
-        screen.blit(title, title_rect)
+        # Background and title never change; widgets are drawn live on top
+        if self._page is None:
+            self._page = self._render_page(screen)
+        screen.blit(self._page, (0, 0))
         
         # Radio buttons
         for radio in self.radio_buttons:
@@ -441,8 +587,35 @@ class AlgorithmSelectionScreen:
                            border_radius=15)
             pygame.draw.rect(screen, (100, 100, 100), self.continue_button.rect, 3,
                            border_radius=15)
-            text = self.font.render('CONTINUE', True, (120, 120, 120))
+            if self._disabled_label is None:
+                self._disabled_label = self.font.render('CONTINUE', True, (120, 120, 120))
+            text = self._disabled_label
             text_rect = text.get_rect(center=self.continue_button.rect.center)
             screen.blit(text, text_rect)
         else:
             self.continue_button.draw(screen, self.font)
+    
+    def _render_page(self, screen) -> pygame.Surface:
+        """Render the gradient background and title into an off-screen surface.
+        
+        Args:
+            screen: Display surface (used for pixel format)
+            
+        Returns:
+            Surface holding the static part of the screen
+        """
+        page = pygame.Surface((self.screen_width, self.screen_height)).convert(screen)
+        
+        # Modern gradient background (dark blue to purple)
+        _draw_gradient(page, self.screen_width, self.screen_height)
+        
+        # Title
+        title = self.title_font.render('SELECT ALGORITHM', True, (255, 255, 255))
+        title_rect = title.get_rect(center=(self.screen_width // 2, 80))
+        
+        # Glow effect for title
+        glow = self.title_font.render('SELECT ALGORITHM', True, (100, 150, 255))
+        glow_rect = glow.get_rect(center=(self.screen_width // 2 + 2, 82))
+        page.blit(glow, glow_rect)
+        page.blit(title, title_rect)
+        return page
@@ -1,7 +1,7 @@
 """Data models for Project ARES."""
 from dataclasses import dataclass, field
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     """Represents a player or enemy agent."""
     name: str
@@ -11,7 +11,7 @@ class Agent:
     path: list[tuple[int, int]] = field(default_factory=list)
     path_index: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class Stats:
     """Statistics for pathfinding algorithm execution."""
     nodes_expanded: int = 0
@@ -20,7 +20,7 @@ class Stats:
     path_cost: float = 0.0
     notes: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class Plan:
     """Represents a tactical plan for combat."""
     actions: list[str] = field(default_factory=list)
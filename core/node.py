@@ -17,6 +17,10 @@ class Node:
         self.pos = pos
         self.neighbors: list[tuple['Node', float]] = []  # (neighbor_node, edge_weight)
         
+        # Cached set of adjacent nodes (rebuilt when neighbors changes)
+        self._neighbor_set: Optional[frozenset['Node']] = None
+        self._neighbor_set_source: Optional[list] = None
+        
         # Pathfinding metadata (dynamic, changes during pathfinding)
         self.visited = False
         self.distance = float('inf')
@@ -42,6 +46,23 @@ class Node:
         # Add reverse connection
         if not any(n == self for n, _ in neighbor.neighbors):
             neighbor.neighbors.append((self, weight))
+        
+        self._neighbor_set = None
+        neighbor._neighbor_set = None
+    
+    def neighbor_set(self) -> frozenset['Node']:
+        """Get the adjacent nodes as a set for O(1) adjacency checks.
+        
+        The set is cached and rebuilt after add_neighbor() or when the
+        neighbors list is replaced.
+        
+        Returns:
+            Frozenset of neighboring nodes
+        """
+        if self._neighbor_set is None or self._neighbor_set_source is not self.neighbors:
+            self._neighbor_set = frozenset(n for n, _ in self.neighbors)
+            self._neighbor_set_source = self.neighbors
+        return self._neighbor_set
     
     def get_weight_to(self, neighbor: 'Node') -> float:
         """Get edge weight to a specific neighbor."""
@@ -3,7 +3,16 @@ import pygame
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+# Number keys that select an algorithm
+_ALGO_KEYS = {
+    pygame.K_1: '1',
+    pygame.K_2: '2',
+    pygame.K_3: '3',
+    pygame.K_4: '4',
+    pygame.K_5: '5',
+}
+
+@dataclass(slots=True)
 class UIState:
     """Represents UI state changes from input."""
     algo_key: Optional[str] = None
@@ -22,16 +31,8 @@ class UIHandler:
         state = UIState()
         
         # Algorithm selection
-        if key == pygame.K_1:
-            state.algo_key = '1'
-        elif key == pygame.K_2:
-            state.algo_key = '2'
-        elif key == pygame.K_3:
-            state.algo_key = '3'
-        elif key == pygame.K_4:
-            state.algo_key = '4'
-        elif key == pygame.K_5:
-            state.algo_key = '5'
+        if key in _ALGO_KEYS:
+            state.algo_key = _ALGO_KEYS[key]
         
         # Pause toggle
         elif key == pygame.K_SPACE:
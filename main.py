@@ -7,6 +7,32 @@ from core.gameplay import GameSession
 from core.graphics import GraphRenderer
 
 
+# Event types each state consumes (expose events trigger a repaint)
+MENU_EVENTS = [
+    pygame.QUIT, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+    pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED
+]
+GAME_EVENTS = [
+    pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN,
+    pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED
+]
+STATE_EVENTS = {
+    STATE_MENU: MENU_EVENTS,
+    STATE_TUTORIAL: MENU_EVENTS,
+    STATE_ALGORITHM_SELECTION: MENU_EVENTS,
+    STATE_PLAYING: GAME_EVENTS,
+    STATE_PAUSED: GAME_EVENTS,
+    STATE_VICTORY: MENU_EVENTS,
+    STATE_DEFEAT: MENU_EVENTS,
+}
+
+# Screens that only change in response to input
+IDLE_STATES = {
+    STATE_MENU, STATE_TUTORIAL, STATE_ALGORITHM_SELECTION, STATE_VICTORY, STATE_DEFEAT
+}
+IDLE_WAIT_MS = 500
+
+
 def main():
     """Main game loop."""
     pygame.init()
@@ -16,6 +42,10 @@ def main():
     pygame.display.set_caption("Algorithm Arena - Educational Pathfinding Game")
     clock = pygame.time.Clock()
     
+    # Only queue events some state handles
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(list(set(MENU_EVENTS + GAME_EVENTS)))
+    
     # Game state
     game_state = STATE_MENU
     selected_algorithm = None
@@ -27,6 +57,13 @@ def main():
     tutorial_screen = TutorialScreen(WINDOW_WIDTH, WINDOW_HEIGHT)
     algorithm_selection_screen = AlgorithmSelectionScreen(WINDOW_WIDTH, WINDOW_HEIGHT)
     
+    # Screens that draw themselves in full (menu-like states)
+    menu_screens = {
+        STATE_MENU: main_menu,
+        STATE_TUTORIAL: tutorial_screen,
+        STATE_ALGORITHM_SELECTION: algorithm_selection_screen,
+    }
+    
     # End screen buttons
     button_width = 180
     button_height = 50
@@ -48,14 +85,69 @@ def main():
         'MAIN MENU'
     )
     
+    # End screen button labels share one font (SysFont lookups are slow)
+    button_font = pygame.font.SysFont('Arial', 16)
+    
+    # Snapshot of the frozen end screen (everything except the buttons)
+    end_screen_background = None
+    
+    # Dirty-rect tracking: gameplay frames only push changed areas to the window
+    previous_dirty_rects = []
+    last_drawn_state = None
+    max_dirty_area = WINDOW_WIDTH * WINDOW_HEIGHT // 4
+    
+    # Idle frames (no input, no animation, no timer change) are not repainted
+    needs_redraw = True
+    
+    # Menu and end screens only push their buttons once drawn in full
+    ui_dirty_rects = None
+    full_refresh = False
+    
+    def ui_state(state):
+        """Widget states (hover/press/selection) that decide how a menu or end screen looks."""
+        if state in menu_screens:
+            return menu_screens[state].visual_state()
+        return (play_again_button.visual_state, main_menu_button.visual_state)
+    
+    drawn_ui_state = None
+    
     # Main loop
     running = True
     while running:
-        current_time = pygame.time.get_ticks()
         delta_time = clock.get_time() / 1000.0
         
-        # Event handling
-        for event in pygame.event.get():
+        # Event handling - fetch only what the current state uses and drop the rest
+        event_types = STATE_EVENTS[game_state]
+        events = []
+        if game_state in IDLE_STATES and not needs_redraw:
+            # Static screen is up to date - sleep until input arrives
+            first = pygame.event.wait(IDLE_WAIT_MS)
+            if first.type in event_types:
+                events.append(first)
+        # Pump the OS queue once; the typed get and the clear reuse that batch
+        pygame.event.pump()
+        events += pygame.event.get(event_types, pump=False)
+        pygame.event.clear(pump=False)
+        current_time = pygame.time.get_ticks()
+        
+        # Only the latest mouse motion of the frame matters
+        last_motion = None
+        for i, event in enumerate(events):
+            if event.type == pygame.MOUSEMOTION:
+                last_motion = i
+        events = [event for i, event in enumerate(events)
+                  if event.type != pygame.MOUSEMOTION or i == last_motion]
+        hover_pos = None
+        
+        for event in events:
+            # Mouse motion only matters if it changes the tooltip or a widget (checked below)
+            if event.type != pygame.MOUSEMOTION:
+                needs_redraw = True
+            
+            # Window contents were lost - present the whole frame
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                full_refresh = True
+            
             if event.type == pygame.QUIT:
                 running = False
             
@@ -82,7 +174,7 @@ def main():
                 if tutorial_screen.handle_event(event):
                     game_state = STATE_MENU
             
-            elif game_state == STATE_PLAYING:
+            elif game_state in [STATE_PLAYING, STATE_PAUSED]:
                 # Keyboard controls
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
@@ -96,48 +188,22 @@ def main():
                         game_session = None
                         renderer = None
                 
-                # Mouse controls
+                # Mouse controls (moves are ignored while paused)
                 elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:  # Left click
+                    if event.button == 1 and game_state == STATE_PLAYING:  # Left click
                         game_session.handle_click(event.pos, current_time)
                 
-                # Hover for tooltip
+                # Hover for tooltip, also while paused (resolved after the event loop)
                 elif event.type == pygame.MOUSEMOTION:
-                    if renderer and game_session:
-                        hovered_node = game_session.graph.get_node_at_pos(event.pos)
-                        renderer.set_tooltip(hovered_node, event.pos)
-            
-            elif game_state == STATE_PAUSED:
-                # Keyboard controls
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE:
-                        game_session.toggle_pause()
-                        game_state = STATE_PLAYING
-                    elif event.key == pygame.K_ESCAPE:
-                        # Return to menu
-                        if game_session:
-                            game_session.sound_manager.stop_bgm()
-                        game_state = STATE_MENU
-                        game_session = None
-                        renderer = None
-                
-                # Hover for tooltip (works while paused!)
-                elif event.type == pygame.MOUSEMOTION:
-                    if renderer and game_session:
-                        hovered_node = game_session.graph.get_node_at_pos(event.pos)
-                        renderer.set_tooltip(hovered_node, event.pos)
+                    hover_pos = event.pos
             
             elif game_state in [STATE_VICTORY, STATE_DEFEAT]:
-                # Update button text for play again
-                play_again_button.text = f'RETRY - {selected_algorithm}'
-                
                 # Handle button clicks
                 if play_again_button.handle_event(event):
-                    # Restart with same algorithm
-                    if game_session:
-                        game_session.sound_manager.stop_bgm()
-                    game_session = GameSession(selected_algorithm)
-                    renderer = GraphRenderer(screen, selected_algorithm)
+                    # Restart with same algorithm, reusing loaded sounds and render caches
+                    game_session.sound_manager.stop_bgm()
+                    game_session = GameSession(selected_algorithm, game_session.sound_manager)
+                    renderer.reset(selected_algorithm)
                     game_state = STATE_PLAYING
                 
                 if main_menu_button.handle_event(event):
@@ -147,11 +213,26 @@ def main():
                     game_session = None
                     renderer = None
         
+        # Menus and end screens only repaint when a widget's look changed
+        if game_state not in [STATE_PLAYING, STATE_PAUSED] and ui_state(game_state) != drawn_ui_state:
+            needs_redraw = True
+        
+        # Hover for tooltip - one node lookup per frame at most
+        if hover_pos and game_state in [STATE_PLAYING, STATE_PAUSED] and renderer and game_session:
+            hovered_node = game_session.graph.get_node_at_pos(hover_pos)
+            if hovered_node or renderer.tooltip_node:
+                needs_redraw = True
+            renderer.set_tooltip(hovered_node, hover_pos)
+        
         # Update game logic
         if game_state == STATE_PLAYING and game_session:
-            game_session.update(current_time, delta_time)
+            if game_session.update(current_time, delta_time):
+                needs_redraw = True
             
             # Check for victory/defeat
+            if game_session.is_victory or game_session.is_defeat:
+                play_again_button.text = f'RETRY - {selected_algorithm}'
+                end_screen_background = None
             if game_session.is_victory:
                 game_state = STATE_VICTORY
                 # Play victory sound
@@ -161,21 +242,25 @@ def main():
                 # Play defeat sound
                 game_session.sound_manager.play_bgm('defeat', loop=False)
         
-        # Rendering
-        if game_state == STATE_MENU:
-            main_menu.draw(screen)
-        
-        elif game_state == STATE_ALGORITHM_SELECTION:
-            algorithm_selection_screen.draw(screen)
+        # Skip repaint entirely when nothing on screen changed
+        if not needs_redraw and game_state == last_drawn_state:
+            clock.tick(FPS)
+            continue
+        needs_redraw = False
         
-        elif game_state == STATE_TUTORIAL:
-            tutorial_screen.draw(screen)
+        # Rendering
+        ui_dirty_rects = None
+        if game_state in menu_screens:
+            ui_dirty_rects = menu_screens[game_state].draw(screen)
         
         elif game_state in [STATE_PLAYING, STATE_PAUSED] and game_session and renderer:
             # Draw game world
-            renderer.draw_background()
-            renderer.draw_edges(game_session.graph, game_session.enemy.path)
-            renderer.draw_nodes(game_session.graph, game_session.player, game_session.enemy)
+            renderer.draw_world(
+                game_session.graph,
+                game_session.enemy.path,
+                game_session.player,
+                game_session.enemy
+            )
             
             # Draw queued path visualization
             renderer.draw_queued_path(screen, game_session.player)
@@ -200,41 +285,54 @@ def main():
             # Draw tooltip
             renderer.draw_tooltip()
         
-        elif game_state == STATE_VICTORY and game_session and renderer:
-            # Draw final game state in background
-            renderer.draw_background()
-            renderer.draw_edges(game_session.graph, game_session.enemy.path)
-            renderer.draw_nodes(game_session.graph, game_session.player, game_session.enemy)
-            
-            # Draw victory screen
-            player_stats = game_session.get_player_stats()
-            enemy_stats = game_session.get_enemy_stats()
-            victory_reason = getattr(game_session, 'victory_reason', "")
-            renderer.draw_victory_screen(player_stats, enemy_stats, game_session.game_time, victory_reason)
+        elif game_state in [STATE_VICTORY, STATE_DEFEAT] and game_session and renderer:
+            # The game is frozen, so the end screen is drawn once and reused
+            if end_screen_background is None:
+                # Draw final game state in background
+                renderer.draw_background()
+                renderer.draw_edges(game_session.graph, game_session.enemy.path)
+                renderer.draw_nodes(game_session.graph, game_session.player, game_session.enemy)
+                
+                # Draw victory/defeat screen
+                player_stats = game_session.get_player_stats()
+                enemy_stats = game_session.get_enemy_stats()
+                if game_state == STATE_VICTORY:
+                    victory_reason = getattr(game_session, 'victory_reason', "")
+                    renderer.draw_victory_screen(player_stats, enemy_stats, game_session.game_time, victory_reason)
+                else:
+                    renderer.draw_defeat_screen(player_stats, enemy_stats, game_session.game_time)
+                end_screen_background = screen.copy()
+            else:
+                screen.blit(end_screen_background, (0, 0))
             
             # Draw buttons
-            button_font = pygame.font.SysFont('Arial', 16)
-            play_again_button.draw(screen, button_font)
-            main_menu_button.draw(screen, button_font)
+            ui_dirty_rects = [
+                play_again_button.draw(screen, button_font),
+                main_menu_button.draw(screen, button_font)
+            ]
         
-        elif game_state == STATE_DEFEAT and game_session and renderer:
-            # Draw final game state in background
-            renderer.draw_background()
-            renderer.draw_edges(game_session.graph, game_session.enemy.path)
-            renderer.draw_nodes(game_session.graph, game_session.player, game_session.enemy)
-            
-            # Draw defeat screen
-            player_stats = game_session.get_player_stats()
-            enemy_stats = game_session.get_enemy_stats()
-            renderer.draw_defeat_screen(player_stats, enemy_stats, game_session.game_time)
-            
-            # Draw buttons
-            button_font = pygame.font.SysFont('Arial', 16)
-            play_again_button.draw(screen, button_font)
-            main_menu_button.draw(screen, button_font)
+        # Update display (full flip on state changes or when much of the screen changed)
+        if full_refresh or game_state != last_drawn_state:
+            pygame.display.flip()
+        elif ui_dirty_rects is not None:
+            # Only button hover/press states change on these screens
+            pygame.display.update(ui_dirty_rects)
+        elif game_state in [STATE_PLAYING, STATE_PAUSED] and renderer:
+            # Include last frame's areas so moved elements are erased
+            dirty_rects = previous_dirty_rects + renderer.dirty_rects
+            dirty_area = sum(rect.width * rect.height for rect in dirty_rects)
+            if len(dirty_rects) < 20 and dirty_area < max_dirty_area:
+                pygame.display.update(dirty_rects)
+            else:
+                pygame.display.flip()
+        else:
+            pygame.display.flip()
+        previous_dirty_rects = renderer.dirty_rects if renderer else []
+        last_drawn_state = game_state
+        if game_state not in [STATE_PLAYING, STATE_PAUSED]:
+            drawn_ui_state = ui_state(game_state)
+        full_refresh = False
         
-        # Update display
-        pygame.display.flip()
         clock.tick(FPS)
     
     pygame.quit()
@@ -0,0 +1,17 @@
+"""Shared pytest setup for the Algorithm Arena tests."""
+import os
+
+# Run pygame headless in every test module, whichever one is imported first
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _pygame():
+    """Initialize pygame once for the whole test session."""
+    pygame.init()
+    yield
+    pygame.quit()
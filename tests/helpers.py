@@ -0,0 +1,11 @@
+"""Shared helpers for the Algorithm Arena tests."""
+
+
+class MockGraph:
+    """Minimal graph over a hand-built list of nodes, for enemy and algorithm tests."""
+    def __init__(self, nodes):
+        self.nodes = nodes
+    
+    def reset_all_nodes(self):
+        for node in self.nodes:
+            node.reset_pathfinding()
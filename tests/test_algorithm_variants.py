@@ -14,6 +14,20 @@ from algorithms.graph_algorithms import (
     astar_local_max_find_path
 )
 from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from tests.helpers import MockGraph
+
+
+@pytest.fixture(scope="module")
+def shared_graph():
+    """Seeded game graph, built once for the whole module."""
+    return Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 10, seed=42)
+
+
+@pytest.fixture
+def graph(shared_graph):
+    """Shared game graph with pathfinding state cleared before each test."""
+    shared_graph.reset_all_nodes()
+    return shared_graph
 
 
 class TestLeafNodeDetection:
@@ -54,15 +68,7 @@ class TestVisitedLeafTracking:
         node2.add_neighbor(node3, 5)
         
         # Create a mock graph
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1, node2, node3]
-            
-            def reset_all_nodes(self):
-                for node in self.nodes:
-                    node.reset_pathfinding()
-        
-        graph = MockGraph()
+        graph = MockGraph([node1, node2, node3])
         visited_leaves = set()
         
         # Find path from node1 to node3 (leaf)
@@ -81,15 +87,7 @@ class TestVisitedLeafTracking:
         node1.add_neighbor(node2, 5)
         node2.add_neighbor(node3, 5)
         
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1, node2, node3]
-            
-            def reset_all_nodes(self):
-                for node in self.nodes:
-                    node.reset_pathfinding()
-        
-        graph = MockGraph()
+        graph = MockGraph([node1, node2, node3])
         
         # Mark node3 as already visited
         visited_leaves = {node3}
@@ -104,9 +102,8 @@ class TestVisitedLeafTracking:
 class TestGreedyLocalVariants:
     """Tests for Greedy Local Min/Max variants."""
     
-    def test_greedy_local_min_finds_path(self):
+    def test_greedy_local_min_finds_path(self, graph):
         """Test that Greedy Local Min can find paths."""
-        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 10, seed=42)
         start = graph.nodes[0]
         goal = graph.nodes[-1]
         
@@ -115,9 +112,8 @@ class TestGreedyLocalVariants:
         # Should find a path (or get stuck trying)
         assert isinstance(path, list), "Should return a path list"
     
-    def test_greedy_local_max_finds_path(self):
+    def test_greedy_local_max_finds_path(self, graph):
         """Test that Greedy Local Max can find paths."""
-        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 10, seed=42)
         start = graph.nodes[0]
         goal = graph.nodes[-1]
         
@@ -139,15 +135,7 @@ class TestGreedyLocalVariants:
         node2.add_neighbor(node3, 5)
         node2.add_neighbor(node4, 5)
         
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1, node2, node3, node4]
-            
-            def reset_all_nodes(self):
-                for node in self.nodes:
-                    node.reset_pathfinding()
-        
-        graph = MockGraph()
+        graph = MockGraph([node1, node2, node3, node4])
         
         # Greedy algorithms should not revisit nodes (no backtracking)
         path, stats = greedy_local_min_find_path(graph, node1, node4)
@@ -160,9 +148,8 @@ class TestGreedyLocalVariants:
 class TestAStarLocalVariants:
     """Tests for A* Local Min/Max variants."""
     
-    def test_astar_local_min_finds_path(self):
+    def test_astar_local_min_finds_path(self, graph):
         """Test that A* Local Min can find paths."""
-        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 10, seed=42)
         start = graph.nodes[0]
         goal = graph.nodes[-1]
         
@@ -170,9 +157,8 @@ class TestAStarLocalVariants:
         
         assert isinstance(path, list), "Should return a path list"
     
-    def test_astar_local_max_finds_path(self):
+    def test_astar_local_max_finds_path(self, graph):
         """Test that A* Local Max can find paths."""
-        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 10, seed=42)
         start = graph.nodes[0]
         goal = graph.nodes[-1]
         
@@ -189,15 +175,7 @@ class TestAStarLocalVariants:
         node1.add_neighbor(node2, 5)
         node2.add_neighbor(node3, 5)
         
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1, node2, node3]
-            
-            def reset_all_nodes(self):
-                for node in self.nodes:
-                    node.reset_pathfinding()
-        
-        graph = MockGraph()
+        graph = MockGraph([node1, node2, node3])
         
         path, stats = astar_local_min_find_path(graph, node1, node3)
         
@@ -209,9 +187,8 @@ class TestAStarLocalVariants:
 class TestAlgorithmDispatcher:
     """Tests for the algorithm dispatcher with new variants."""
     
-    def test_dispatcher_handles_all_variants(self):
+    def test_dispatcher_handles_all_variants(self, graph):
         """Test that dispatcher correctly routes to all algorithm variants."""
-        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 10, seed=42)
         start = graph.nodes[0]
         goal = graph.nodes[5]
         
@@ -234,9 +211,8 @@ class TestAlgorithmDispatcher:
 class TestEnemyAIVisitedLeaves:
     """Tests for enemy AI tracking visited leaves."""
     
-    def test_enemy_ai_initializes_visited_leaves(self):
+    def test_enemy_ai_initializes_visited_leaves(self, graph):
         """Test that enemy AI initializes visited leaves set."""
-        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 10, seed=42)
         start = graph.nodes[0]
         
         enemy = EnemyAI(start, 'BFS', graph)
@@ -244,9 +220,8 @@ class TestEnemyAIVisitedLeaves:
         assert hasattr(enemy, 'visited_leaves'), "Enemy should have visited_leaves attribute"
         assert isinstance(enemy.visited_leaves, set), "visited_leaves should be a set"
     
-    def test_enemy_ai_uses_visited_leaves_for_bfs(self):
+    def test_enemy_ai_uses_visited_leaves_for_bfs(self, graph):
         """Test that enemy AI passes visited leaves to BFS."""
-        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 10, seed=42)
         start = graph.nodes[0]
         
         enemy = EnemyAI(start, 'BFS', graph)
@@ -42,3 +42,11 @@ def test_no_path_exists():
     path, stats = bfs.find_path(grid, start, goal)
     
     assert len(path) == 0
+
+def test_stats_has_no_instance_dict():
+    """Test that Stats uses slots (one is created per search)."""
+    _, stats = bfs.find_path(Grid(5, 5, obstacle_ratio=0.0), (0, 0), (4, 4))
+    
+    assert not hasattr(stats, '__dict__')
+    with pytest.raises(AttributeError):
+        stats.unknown_field = 1
@@ -1,5 +1,6 @@
 """Tests for bug fixes in Algorithm Arena game."""
 import pytest
+from collections import deque
 from core.node import Node
 from core.graph import Graph
 from core.gameplay import PlayerEntity, EnemyAI, GameSession
@@ -7,6 +8,31 @@ from algorithms.graph_algorithms import find_path
 from config import WINDOW_WIDTH, WINDOW_HEIGHT, NUM_NODES, ENEMY_SPEEDS
 
 
+@pytest.fixture(scope="module")
+def graph():
+    """Seeded full-size game graph, built once for the structure tests."""
+    return Graph(WINDOW_WIDTH, WINDOW_HEIGHT, NUM_NODES, seed=42)
+
+
+@pytest.fixture(scope="module")
+def path_graph():
+    """Seeded 20-node graph shared by the path cost tests (searches reset it)."""
+    return Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 20, seed=42)
+
+
+@pytest.fixture(scope="module")
+def small_graph():
+    """Seeded 10-node graph shared by the zero-cost tests (searches reset it)."""
+    return Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 10, seed=42)
+
+
+def _verify_cost(path: list[Node], stats):
+    """Check that the reported path cost is the sum of the edge weights along the path."""
+    expected_cost = sum(node.get_weight_to(next_node) for node, next_node in zip(path, path[1:]))
+    
+    assert stats.path_cost == pytest.approx(expected_cost, abs=0.01), "Path cost should match manual calculation"
+
+
 class TestBugFix1_EnemySpeed:
     """Tests for Bug Fix 1: Enemy Speed adjustments."""
     
@@ -51,38 +77,25 @@ class TestBugFix2_EnemyStickingBug:
 class TestBugFix3_GraphStructure:
     """Tests for Bug Fix 3: Graph structure with max 3 neighbors."""
     
-    def test_graph_has_correct_node_count(self):
+    def test_graph_has_correct_node_count(self, graph):
         """Test that graph has 25-30 nodes."""
-        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, NUM_NODES, seed=42)
         assert 25 <= len(graph.nodes) <= 30, f"Graph should have 25-30 nodes, got {len(graph.nodes)}"
     
-    def test_max_neighbors_is_3(self):
-        """Test that no node has more than 3 neighbors."""
-        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, NUM_NODES, seed=42)
-        
-        for node in graph.nodes:
-            num_neighbors = len(node.neighbors)
-            assert num_neighbors <= 3, f"Node {node.label} has {num_neighbors} neighbors, max should be 3"
-    
-    def test_min_neighbors_is_1(self):
-        """Test that all nodes have at least 1 neighbor."""
-        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, NUM_NODES, seed=42)
-        
-        for node in graph.nodes:
-            num_neighbors = len(node.neighbors)
-            assert num_neighbors >= 1, f"Node {node.label} has {num_neighbors} neighbors, min should be 1"
+    def test_neighbor_counts_between_1_and_3(self, graph):
+        """Test that every node has at least 1 and at most 3 neighbors."""
+        bad_nodes = [f"{node.label} ({len(node.neighbors)})" for node in graph.nodes
+                     if not 1 <= len(node.neighbors) <= 3]
+        assert not bad_nodes, f"Nodes should have 1-3 neighbors, got: {', '.join(bad_nodes)}"
     
-    def test_graph_is_connected(self):
+    def test_graph_is_connected(self, graph):
         """Test that graph is still fully connected with max 3 neighbors."""
-        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, NUM_NODES, seed=42)
-        
         # BFS from first node
         visited = set()
-        queue = [graph.nodes[0]]
+        queue = deque([graph.nodes[0]])
         visited.add(graph.nodes[0])
         
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             for neighbor, _ in current.neighbors:
                 if neighbor not in visited:
                     visited.add(neighbor)
@@ -91,89 +104,36 @@ class TestBugFix3_GraphStructure:
         # All nodes should be reachable
         assert len(visited) == len(graph.nodes), "Graph should be fully connected"
     
-    def test_some_dead_ends_exist(self):
+    def test_some_dead_ends_exist(self, graph):
         """Test that some nodes have only 1 neighbor (dead-ends for strategy)."""
-        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, NUM_NODES, seed=42)
-        
-        dead_end_count = sum(1 for node in graph.nodes if len(node.neighbors) == 1)
-        assert dead_end_count >= 1, "Graph should have at least 1 dead-end node"
+        assert any(node.is_leaf() for node in graph.nodes), "Graph should have at least 1 dead-end node"
 
 
 class TestBugFix4_PathCostDisplay:
     """Tests for Bug Fix 4: Enemy final path cost showing correctly."""
     
-    def test_bfs_calculates_path_cost(self):
-        """Test that BFS calculates path cost."""
-        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 20, seed=42)
-        start = graph.nodes[0]
-        goal = graph.nodes[-1]
-        
-        path, stats = find_path('BFS', graph, start, goal)
-        
-        assert len(path) > 0, "Path should be found"
-        assert stats.path_cost > 0, "BFS should calculate path cost"
-        
-        # Manually calculate path cost to verify
-        expected_cost = 0.0
-        for i in range(len(path) - 1):
-            weight = path[i].get_weight_to(path[i + 1])
-            expected_cost += weight
-        
-        assert abs(stats.path_cost - expected_cost) < 0.01, "Path cost should match manual calculation"
-    
-    def test_dfs_calculates_path_cost(self):
-        """Test that DFS calculates path cost."""
-        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 20, seed=42)
-        start = graph.nodes[0]
-        goal = graph.nodes[-1]
-        
-        path, stats = find_path('DFS', graph, start, goal)
-        
-        assert len(path) > 0, "Path should be found"
-        assert stats.path_cost > 0, "DFS should calculate path cost"
-    
-    def test_ucs_calculates_path_cost(self):
-        """Test that UCS calculates path cost."""
-        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 20, seed=42)
-        start = graph.nodes[0]
-        goal = graph.nodes[-1]
-        
-        path, stats = find_path('UCS', graph, start, goal)
-        
-        assert len(path) > 0, "Path should be found"
-        assert stats.path_cost > 0, "UCS should calculate path cost"
-    
-    def test_greedy_calculates_path_cost(self):
-        """Test that Greedy calculates path cost."""
-        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 20, seed=42)
-        start = graph.nodes[0]
-        goal = graph.nodes[-1]
-        
-        path, stats = find_path('Greedy', graph, start, goal)
-        
-        assert len(path) > 0, "Path should be found"
-        assert stats.path_cost > 0, "Greedy should calculate path cost"
-    
-    def test_astar_calculates_path_cost(self):
-        """Test that A* calculates path cost."""
-        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 20, seed=42)
-        start = graph.nodes[0]
-        goal = graph.nodes[-1]
+    @pytest.mark.parametrize("algo", ['BFS', 'DFS', 'UCS', 'Greedy', 'A*'])
+    def test_algo_calculates_path_cost(self, path_graph, algo):
+        """Test that each algorithm calculates the cost of the path it finds."""
+        start = path_graph.nodes[0]
+        goal = path_graph.nodes[-1]
         
-        path, stats = find_path('A*', graph, start, goal)
+        path, stats = find_path(algo, path_graph, start, goal)
         
         assert len(path) > 0, "Path should be found"
-        assert stats.path_cost > 0, "A* should calculate path cost"
+        assert stats.path_cost > 0, f"{algo} should calculate path cost"
+        _verify_cost(path, stats)
     
-    def test_same_start_goal_has_zero_cost(self):
+    @pytest.mark.parametrize("algo", ['BFS', 'DFS', 'UCS', 'Greedy (Local Min)', 'Greedy (Local Max)',
+                                      'A* (Local Min)', 'A* (Local Max)'])
+    def test_same_start_goal_has_zero_cost(self, small_graph, algo):
         """Test that path cost is 0 when start equals goal."""
-        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 10, seed=42)
-        node = graph.nodes[0]
+        node = small_graph.nodes[0]
         
-        for algo in ['BFS', 'DFS', 'UCS', 'Greedy (Local Min)', 'Greedy (Local Max)', 
-                     'A* (Local Min)', 'A* (Local Max)']:
-            path, stats = find_path(algo, graph, node, node)
-            assert stats.path_cost == 0.0, f"{algo} should have 0 path cost when start equals goal"
+        path, stats = find_path(algo, small_graph, node, node)
+        assert stats.path_cost == 0.0, f"{algo} should have 0 path cost when start equals goal"
+        assert path == [node], f"{algo} path should be just the start node"
+        assert stats.nodes_expanded == 0, f"{algo} should return without expanding any node"
     
     def test_game_session_has_enemy_stats(self):
         """Test that GameSession.get_enemy_stats() returns path_cost."""
@@ -2,47 +2,68 @@
 import pytest
 from core.node import Node
 from core.gameplay import EnemyAI
+from tests.helpers import MockGraph
 
 
-class MockGraph:
-    """Mock graph for testing."""
-    def __init__(self, nodes):
-        self.nodes = nodes
+@pytest.fixture(scope="module")
+def shared_star():
+    """Hub N1 joined to N2, N3 and N4 (in that order), built once for the module.
     
-    def reset_all_nodes(self):
-        for node in self.nodes:
-            node.reset_pathfinding()
+    Values per node (heuristic, path_cost, f-cost):
+        N1: 100, 100, 200  (enemy start)
+        N2:  12,   5,  17  (lowest h, g and f)
+        N3: 214,  50, 264  (highest h and f)
+        N4: 102,  23, 125
+    """
+    n1 = Node("N1", (100, 100))
+    n2 = Node("N2", (200, 100))
+    n3 = Node("N3", (300, 100))
+    n4 = Node("N4", (150, 150))
+    
+    for node, heuristic, path_cost in [(n1, 100.0, 100.0), (n2, 12.0, 5.0),
+                                       (n3, 214.0, 50.0), (n4, 102.0, 23.0)]:
+        node.heuristic = heuristic
+        node.path_cost = path_cost
+    
+    n1.add_neighbor(n2, 5)
+    n1.add_neighbor(n3, 3)
+    n1.add_neighbor(n4, 7)
+    
+    return MockGraph([n1, n2, n3, n4])
+
+
+@pytest.fixture
+def star(shared_star):
+    """Shared star graph with pathfinding state cleared before each test."""
+    shared_star.reset_all_nodes()
+    return shared_star
+
+
+class TestNeighborSelection:
+    """Test that each algorithm picks its neighbor by its own rule."""
+    
+    @pytest.mark.parametrize("algorithm,expected", [
+        ('Greedy (Local Min)', "N2"),  # Lowest heuristic, even though it is a dead-end
+        ('Greedy (Local Max)', "N3"),  # Highest heuristic
+        ('UCS', "N2"),                 # Lowest path cost
+        ('A* (Local Min)', "N2"),      # Lowest f-cost (h + g)
+        ('A* (Local Max)', "N3"),      # Highest f-cost (h + g)
+        ('BFS', "N2"),                 # First unvisited neighbor (queue behavior)
+        ('DFS', "N4"),                 # Last unvisited neighbor (stack behavior)
+    ])
+    def test_picks_neighbor_by_algorithm_rule(self, star, algorithm, expected):
+        """Test that the enemy at the hub moves to the neighbor its algorithm selects."""
+        n1, _, _, n4 = star.nodes
+        enemy = EnemyAI(n1, algorithm, star)
+        
+        next_move = enemy.get_next_move(n4)  # Player is at N4
+        assert next_move is not None, f"{algorithm} should not be stuck at the hub"
+        assert next_move.label == expected, f"{algorithm} should pick {expected}"
 
 
 class TestGreedyLocalMinMovement:
     """Test Greedy (Local Min) pure greedy movement."""
     
-    def test_picks_lowest_heuristic_neighbor(self):
-        """Test that enemy picks neighbor with lowest heuristic value."""
-        # Create nodes with specific heuristic values
-        n1 = Node("N1", (100, 100))
-        n2 = Node("N2", (200, 100))
-        n3 = Node("N3", (300, 100))
-        n4 = Node("N4", (150, 150))
-        
-        # Set static heuristic values
-        n1.heuristic = 100.0
-        n2.heuristic = 12.0  # Lowest - should be picked even if dead-end
-        n3.heuristic = 214.0
-        n4.heuristic = 102.0
-        
-        # Connect nodes
-        n1.add_neighbor(n2, 5)
-        n1.add_neighbor(n3, 3)
-        n1.add_neighbor(n4, 7)
-        
-        graph = MockGraph([n1, n2, n3, n4])
-        enemy = EnemyAI(n1, 'Greedy (Local Min)', graph)
-        
-        # Enemy should pick n2 (lowest heuristic)
-        next_move = enemy.get_next_move(n4)  # Player is at n4
-        assert next_move == n2, "Enemy should pick neighbor with lowest heuristic"
-    
     def test_avoids_visited_nodes(self):
         """Test that enemy doesn't revisit nodes."""
         n1 = Node("N1", (100, 100))
@@ -89,159 +110,6 @@ class TestGreedyLocalMinMovement:
         assert enemy.stuck == True, "Enemy should set stuck flag"
 
 
-class TestGreedyLocalMaxMovement:
-    """Test Greedy (Local Max) pure greedy movement."""
-    
-    def test_picks_highest_heuristic_neighbor(self):
-        """Test that enemy picks neighbor with highest heuristic value."""
-        n1 = Node("N1", (100, 100))
-        n2 = Node("N2", (200, 100))
-        n3 = Node("N3", (300, 100))
-        n4 = Node("N4", (150, 150))
-        
-        n1.heuristic = 100.0
-        n2.heuristic = 12.0
-        n3.heuristic = 214.0  # Highest - should be picked
-        n4.heuristic = 102.0
-        
-        n1.add_neighbor(n2, 5)
-        n1.add_neighbor(n3, 3)
-        n1.add_neighbor(n4, 7)
-        
-        graph = MockGraph([n1, n2, n3, n4])
-        enemy = EnemyAI(n1, 'Greedy (Local Max)', graph)
-        
-        next_move = enemy.get_next_move(n4)
-        assert next_move == n3, "Enemy should pick neighbor with highest heuristic"
-
-
-class TestUCSMovement:
-    """Test UCS pure greedy movement."""
-    
-    def test_picks_lowest_path_cost_neighbor(self):
-        """Test that enemy picks neighbor with lowest path cost value."""
-        n1 = Node("N1", (100, 100))
-        n2 = Node("N2", (200, 100))
-        n3 = Node("N3", (300, 100))
-        n4 = Node("N4", (150, 150))
-        
-        n1.path_cost = 100.0
-        n2.path_cost = 5.0   # Lowest - should be picked even if dead-end
-        n3.path_cost = 50.0
-        n4.path_cost = 23.0
-        
-        n1.add_neighbor(n2, 5)
-        n1.add_neighbor(n3, 3)
-        n1.add_neighbor(n4, 7)
-        
-        graph = MockGraph([n1, n2, n3, n4])
-        enemy = EnemyAI(n1, 'UCS', graph)
-        
-        next_move = enemy.get_next_move(n4)
-        assert next_move == n2, "Enemy should pick neighbor with lowest path cost"
-
-
-class TestAStarMovement:
-    """Test A* variants pure greedy movement."""
-    
-    def test_astar_local_min_picks_lowest_f_cost(self):
-        """Test that A* (Local Min) picks neighbor with lowest f-cost (h + g)."""
-        n1 = Node("N1", (100, 100))
-        n2 = Node("N2", (200, 100))
-        n3 = Node("N3", (300, 100))
-        
-        # Set heuristic and path_cost
-        n1.heuristic = 10.0
-        n1.path_cost = 10.0
-        # f_cost = 20.0
-        
-        n2.heuristic = 5.0
-        n2.path_cost = 10.0
-        # f_cost = 15.0 (lowest)
-        
-        n3.heuristic = 20.0
-        n3.path_cost = 5.0
-        # f_cost = 25.0
-        
-        n1.add_neighbor(n2, 5)
-        n1.add_neighbor(n3, 3)
-        
-        graph = MockGraph([n1, n2, n3])
-        enemy = EnemyAI(n1, 'A* (Local Min)', graph)
-        
-        next_move = enemy.get_next_move(n3)
-        assert next_move == n2, "Enemy should pick neighbor with lowest f-cost"
-    
-    def test_astar_local_max_picks_highest_f_cost(self):
-        """Test that A* (Local Max) picks neighbor with highest f-cost."""
-        n1 = Node("N1", (100, 100))
-        n2 = Node("N2", (200, 100))
-        n3 = Node("N3", (300, 100))
-        
-        n1.heuristic = 10.0
-        n1.path_cost = 10.0
-        # f_cost = 20.0
-        
-        n2.heuristic = 5.0
-        n2.path_cost = 10.0
-        # f_cost = 15.0
-        
-        n3.heuristic = 20.0
-        n3.path_cost = 5.0
-        # f_cost = 25.0 (highest)
-        
-        n1.add_neighbor(n2, 5)
-        n1.add_neighbor(n3, 3)
-        
-        graph = MockGraph([n1, n2, n3])
-        enemy = EnemyAI(n1, 'A* (Local Max)', graph)
-        
-        next_move = enemy.get_next_move(n3)
-        assert next_move == n3, "Enemy should pick neighbor with highest f-cost"
-
-
-class TestBFSDFSMovement:
-    """Test BFS and DFS pure greedy movement."""
-    
-    def test_bfs_picks_first_unvisited_neighbor(self):
-        """Test that BFS picks first unvisited neighbor (queue behavior)."""
-        n1 = Node("N1", (100, 100))
-        n2 = Node("N2", (200, 100))
-        n3 = Node("N3", (300, 100))
-        n4 = Node("N4", (150, 150))
-        
-        # Order matters for BFS - should pick first in neighbors list
-        n1.neighbors = [(n2, 5), (n3, 3), (n4, 7)]
-        n2.neighbors = [(n1, 5)]
-        n3.neighbors = [(n1, 3)]
-        n4.neighbors = [(n1, 7)]
-        
-        graph = MockGraph([n1, n2, n3, n4])
-        enemy = EnemyAI(n1, 'BFS', graph)
-        
-        next_move = enemy.get_next_move(n4)
-        assert next_move == n2, "BFS should pick first unvisited neighbor"
-    
-    def test_dfs_picks_last_unvisited_neighbor(self):
-        """Test that DFS picks last unvisited neighbor (stack behavior)."""
-        n1 = Node("N1", (100, 100))
-        n2 = Node("N2", (200, 100))
-        n3 = Node("N3", (300, 100))
-        n4 = Node("N4", (150, 150))
-        
-        # Order matters for DFS - should pick last in neighbors list
-        n1.neighbors = [(n2, 5), (n3, 3), (n4, 7)]
-        n2.neighbors = [(n1, 5)]
-        n3.neighbors = [(n1, 3)]
-        n4.neighbors = [(n1, 7)]
-        
-        graph = MockGraph([n1, n2, n3, n4])
-        enemy = EnemyAI(n1, 'DFS', graph)
-        
-        next_move = enemy.get_next_move(n4)
-        assert next_move == n4, "DFS should pick last unvisited neighbor"
-
-
 class TestEnemyStuckDetection:
     """Test enemy stuck detection and victory condition."""
     
@@ -3,29 +3,24 @@ import pytest
 from core.node import Node
 from core.graph import Graph
 from core.gameplay import EnemyAI, GameSession
+from core.sound_manager import SoundManager
 from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from tests.helpers import MockGraph
 
 
-class MockGraph:
-    """Mock graph for testing."""
-    def __init__(self, nodes):
-        self.nodes = nodes
-    
-    def reset_all_nodes(self):
-        for node in self.nodes:
-            node.reset_pathfinding()
+@pytest.fixture(scope="module")
+def sound_manager():
+    """Sound manager shared by the module's sessions, so sound files load once."""
+    return SoundManager()
 
 
 class TestGameBalance:
     """Test that game balance creates enemy-favorable patterns ~50% of time."""
     
-    def test_balanced_costs_creates_patterns(self):
+    def test_balanced_costs_creates_patterns(self, sound_manager):
         """Test that balanced cost assignment creates different patterns."""
-        import pygame
-        pygame.init()
-        
         # Create multiple sessions - some should favor enemy
-        sessions = [GameSession('Greedy (Local Min)') for _ in range(10)]
+        sessions = [GameSession('Greedy (Local Min)', sound_manager) for _ in range(10)]
         
         # All sessions should have valid costs
         for session in sessions:
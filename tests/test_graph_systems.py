@@ -1,5 +1,6 @@
 """Tests for graph-based Algorithm Arena systems."""
 import pytest
+from collections import deque
 from core.node import Node
 from core.graph import Graph
 from core.combat import CombatSystem, CombatEntity
@@ -40,14 +41,30 @@ class TestNode:
         
         assert node1.get_weight_to(node2) == 7.5
         assert node2.get_weight_to(node1) == 7.5
-    
+
+    def test_neighbor_set_tracks_changes(self):
+        """Test that the cached neighbor set follows neighbor updates."""
+        node1 = Node("N1", (100, 100))
+        node2 = Node("N2", (200, 100))
+        node3 = Node("N3", (300, 100))
+
+        node1.add_neighbor(node2, 1.0)
+        assert node1.neighbor_set() == {node2}
+        assert node1.neighbor_set() is node1.neighbor_set()
+
+        node3.add_neighbor(node1, 2.0)
+        assert node1.neighbor_set() == {node2, node3}
+
+        node1.neighbors = [(node3, 2.0)]
+        assert node1.neighbor_set() == {node3}
+
     def test_distance_to(self):
         """Test Euclidean distance calculation."""
         node1 = Node("N1", (0, 0))
         node2 = Node("N2", (3, 4))
         
         distance = node1.distance_to(node2)
-        assert abs(distance - 5.0) < 0.001
+        assert distance == pytest.approx(5.0, abs=0.001)
     
     def test_reset_pathfinding(self):
         """Test resetting pathfinding metadata."""
@@ -84,11 +101,11 @@ class TestGraph:
         
         # BFS from first node
         visited = set()
-        queue = [graph.nodes[0]]
+        queue = deque([graph.nodes[0]])
         visited.add(graph.nodes[0])
         
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             for neighbor, _ in current.neighbors:
                 if neighbor not in visited:
                     visited.add(neighbor)
@@ -106,6 +123,16 @@ class TestGraph:
             assert 0 <= x <= WINDOW_WIDTH
             assert 0 <= y <= WINDOW_HEIGHT
     
+    def test_edges_listed_once(self):
+        """Test that the edge list holds each undirected edge exactly once."""
+        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 20, seed=42)
+        
+        pairs = {frozenset((a, b)) for a, b, _ in graph.edges}
+        assert len(pairs) == len(graph.edges)
+        assert len(graph.edges) == sum(len(node.neighbors) for node in graph.nodes) // 2
+        for a, b, weight in graph.edges:
+            assert a.get_weight_to(b) == weight
+    
     def test_get_node_by_label(self):
         """Test finding node by label."""
         graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 10, seed=42)
@@ -129,6 +156,50 @@ class TestGraph:
         found = graph.get_node_at_pos((10000, 10000), radius=30)
         assert found is None
 
+    def test_get_node_at_pos_matches_linear_scan(self):
+        """Test spatial hash lookup agrees with checking every node."""
+        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, NUM_NODES, seed=42)
+
+        for x in range(0, WINDOW_WIDTH, 7):
+            for y in range(0, WINDOW_HEIGHT, 7):
+                expected = None
+                for node in graph.nodes:
+                    if node.distance_to(Node("P", (x, y))) <= 30:
+                        expected = node
+                        break
+                assert graph.get_node_at_pos((x, y)) == expected, f"Mismatch at {(x, y)}"
+    
+    def test_get_node_at_pos_large_radius(self):
+        """Test vectorized lookup used for large search radii."""
+        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 10, seed=42)
+        
+        # Radius covering the whole window returns the first node in graph order
+        assert graph.get_node_at_pos((0, 0), radius=5000) == graph.nodes[0]
+        assert graph.node_positions.shape == (10, 2)
+        
+        # Far away point with a large radius still misses
+        assert graph.get_node_at_pos((100000, 100000), radius=1000) is None
+    
+    def test_get_node_at_pos_reuses_last_lookup(self, monkeypatch):
+        """Test that hover and click at the same position share one lookup."""
+        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 10, seed=42)
+        pos = graph.nodes[3].pos
+        
+        searches = []
+        find_node_at_pos = graph._find_node_at_pos
+        def counting_find(*args):
+            searches.append(args)
+            return find_node_at_pos(*args)
+        monkeypatch.setattr(graph, '_find_node_at_pos', counting_find)
+        
+        assert graph.get_node_at_pos(pos) == graph.nodes[3]
+        assert graph.get_node_at_pos(pos) == graph.nodes[3]
+        assert len(searches) == 1, "Repeated lookup at the same position should reuse the result"
+        
+        other_pos = graph.nodes[5].pos
+        assert graph.get_node_at_pos(other_pos) == graph.nodes[5]
+        assert len(searches) == 2, "A new position should run a new search"
+
 
 class TestGraphAlgorithms:
     """Tests for graph-based pathfinding algorithms."""
@@ -336,12 +407,19 @@ class TestGameplay:
         graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 20, seed=42)
         node = graph.nodes[0]
         
-        enemy = EnemyAI(node, 'A*', graph)
+        enemy = EnemyAI(node, 'A* (Local Min)', graph)
         
         assert enemy.node == node
-        assert enemy.algorithm == 'A*'
+        assert enemy.algorithm == 'A* (Local Min)'
         assert len(enemy.path) == 0
     
+    def test_enemy_ai_rejects_unknown_algorithm(self):
+        """Test that an unknown algorithm name fails at construction."""
+        graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 20, seed=42)
+        
+        with pytest.raises(KeyError):
+            EnemyAI(graph.nodes[0], 'A*', graph)
+    
     def test_enemy_recalculates_path(self):
         """Test enemy movement decision (pure greedy, no pathfinding)."""
         graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, 20, seed=42)
@@ -363,14 +441,43 @@ class TestGameplay:
     
     def test_game_session_creation(self):
         """Test game session initialization."""
-        session = GameSession('A*')
+        session = GameSession('A* (Local Min)')
         
-        assert session.algorithm == 'A*'
+        assert session.algorithm == 'A* (Local Min)'
         assert len(session.graph.nodes) > 0
         assert session.player.node is not None
         assert session.enemy.node is not None
         assert session.combat.player.hp == 100
         assert session.combat.enemy.hp == 150
+    
+    def test_game_session_update_reports_changes(self):
+        """Test that update reports whether the frame needs repainting."""
+        session = GameSession('BFS')
+        start = session.start_ticks  # Stay within the first second so game_time never changes
+        session.enemy.last_move_time = start + 100 - session.enemy.move_delay  # Enemy is due to move
+        
+        # Enemy starts moving
+        assert session.update(start + 100, 0.016)
+        assert session.enemy.animating
+        
+        # Frame that finishes the enemy animation still repaints
+        assert session.update(start + 600, 0.016)
+        assert not session.enemy.animating
+        
+        # Idle frame in the same second: nothing moved, nothing to repaint
+        assert not session.update(start + 700, 0.016)
+        assert session.game_time == 0
+        
+        # Nothing changes while paused
+        session.toggle_pause()
+        assert not session.update(start + 20000, 0.016)
+    
+    def test_game_time_follows_frame_timestamp(self):
+        """Test that game time is derived from the timestamp passed to update."""
+        session = GameSession('BFS')
+        
+        session.update(session.start_ticks + 5500, 0.016)
+        assert session.game_time == 5
 
 
 if __name__ == '__main__':
@@ -4,6 +4,7 @@ from core.node import Node
 from core.graph import Graph
 from core.gameplay import EnemyAI
 from algorithms.graph_algorithms import find_path
+from tests.helpers import MockGraph
 
 
 class TestPersistentVisitedNodes:
@@ -21,15 +22,7 @@ class TestPersistentVisitedNodes:
         node2.add_neighbor(node3, 5)
         node2.add_neighbor(node4, 5)
         
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1, node2, node3, node4]
-            
-            def reset_all_nodes(self):
-                for node in self.nodes:
-                    node.reset_pathfinding()
-        
-        graph = MockGraph()
+        graph = MockGraph([node1, node2, node3, node4])
         visited_nodes = set()
         
         # First search: N1 to N3
@@ -61,15 +54,7 @@ class TestPersistentVisitedNodes:
         node1.add_neighbor(node2, 5)
         node2.add_neighbor(node3, 5)
         
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1, node2, node3]
-            
-            def reset_all_nodes(self):
-                for node in self.nodes:
-                    node.reset_pathfinding()
-        
-        graph = MockGraph()
+        graph = MockGraph([node1, node2, node3])
         visited_nodes = set()
         
         path1, stats1 = find_path('Greedy (Local Max)', graph, node1, node3, None, visited_nodes)
@@ -93,15 +78,7 @@ class TestPersistentVisitedNodes:
         node1.add_neighbor(node2, 5)
         node2.add_neighbor(node3, 5)
         
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1, node2, node3]
-            
-            def reset_all_nodes(self):
-                for node in self.nodes:
-                    node.reset_pathfinding()
-        
-        graph = MockGraph()
+        graph = MockGraph([node1, node2, node3])
         visited_nodes = set()
         
         path1, stats1 = find_path('A* (Local Min)', graph, node1, node3, None, visited_nodes)
@@ -122,15 +99,7 @@ class TestPersistentVisitedNodes:
         node1.add_neighbor(node2, 5)
         node2.add_neighbor(node3, 5)
         
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1, node2, node3]
-            
-            def reset_all_nodes(self):
-                for node in self.nodes:
-                    node.reset_pathfinding()
-        
-        graph = MockGraph()
+        graph = MockGraph([node1, node2, node3])
         visited_nodes = set()
         
         path1, stats1 = find_path('A* (Local Max)', graph, node1, node3, None, visited_nodes)
@@ -150,15 +119,7 @@ class TestPersistentVisitedNodes:
         node1.add_neighbor(node2, 5)
         node2.add_neighbor(node3, 5)
         
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1, node2, node3]
-            
-            def reset_all_nodes(self):
-                for node in self.nodes:
-                    node.reset_pathfinding()
-        
-        graph = MockGraph()
+        graph = MockGraph([node1, node2, node3])
         visited_leaves = set()
         visited_nodes = set()
         
@@ -181,15 +142,7 @@ class TestPersistentVisitedNodes:
         node1.add_neighbor(node2, 5)
         node2.add_neighbor(node3, 5)
         
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1, node2, node3]
-            
-            def reset_all_nodes(self):
-                for node in self.nodes:
-                    node.reset_pathfinding()
-        
-        graph = MockGraph()
+        graph = MockGraph([node1, node2, node3])
         
         # Create enemy AI with Greedy algorithm
         enemy = EnemyAI(node1, 'Greedy (Local Min)', graph)
@@ -222,15 +175,7 @@ class TestPersistentVisitedNodes:
         node2.add_neighbor(node3, 5)
         node1.add_neighbor(node4, 5)
         
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1, node2, node3, node4]
-            
-            def reset_all_nodes(self):
-                for node in self.nodes:
-                    node.reset_pathfinding()
-        
-        graph = MockGraph()
+        graph = MockGraph([node1, node2, node3, node4])
         
         # Enemy starts at node1
         enemy = EnemyAI(node1, 'Greedy (Local Min)', graph)
@@ -269,14 +214,7 @@ class TestVisitedNodesInitialization:
         """Test that EnemyAI initializes with empty visited_nodes set."""
         node1 = Node("N1", (100, 100))
         
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1]
-            
-            def reset_all_nodes(self):
-                pass
-        
-        graph = MockGraph()
+        graph = MockGraph([node1])
         enemy = EnemyAI(node1, 'BFS', graph)
         
         assert hasattr(enemy, 'visited_nodes'), "Enemy should have visited_nodes"
@@ -287,14 +225,7 @@ class TestVisitedNodesInitialization:
         """Test that EnemyAI initializes with empty visited_leaves set."""
         node1 = Node("N1", (100, 100))
         
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1]
-            
-            def reset_all_nodes(self):
-                pass
-        
-        graph = MockGraph()
+        graph = MockGraph([node1])
         enemy = EnemyAI(node1, 'BFS', graph)
         
         assert hasattr(enemy, 'visited_leaves'), "Enemy should have visited_leaves"
@@ -2,16 +2,7 @@
 import pytest
 from core.node import Node
 from core.gameplay import EnemyAI
-
-
-class MockGraph:
-    """Mock graph for testing."""
-    def __init__(self, nodes):
-        self.nodes = nodes
-    
-    def reset_all_nodes(self):
-        for node in self.nodes:
-            node.reset_pathfinding()
+from tests.helpers import MockGraph
 
 
 class TestGreedyLocalMinPlateauDetection:
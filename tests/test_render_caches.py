@@ -0,0 +1,313 @@
+"""Tests for cached rendering in menus and the game renderer."""
+import pytest
+import pygame
+from core.menu import Button, RadioButton, TutorialScreen, MainMenu, AlgorithmSelectionScreen
+from core.graphics import GlyphAtlas, GraphRenderer
+from core.gameplay import GameSession
+from config import *
+
+
+class TestTutorialPageCache:
+    """Tests for the pre-rendered tutorial page and menu backdrops."""
+
+    def test_page_rendered_once(self):
+        """Test that the static page is built on first draw and then reused."""
+        screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        tutorial = TutorialScreen(WINDOW_WIDTH, WINDOW_HEIGHT)
+
+        assert tutorial._page is None, "Page should be built lazily"
+
+        tutorial.draw(screen)
+        page = tutorial._page
+        assert page is not None, "Page should be cached after first draw"
+        assert page.get_size() == screen.get_size()
+
+        tutorial.draw(screen)
+        assert tutorial._page is page, "Cached page should be reused between frames"
+
+    def test_page_matches_screen_background(self):
+        """Test that drawing the cached page fills the screen background."""
+        screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        tutorial = TutorialScreen(WINDOW_WIDTH, WINDOW_HEIGHT)
+
+        tutorial.draw(screen)
+
+        assert screen.get_at((5, 5))[:3] == (20, 20, 30)
+
+    @pytest.mark.parametrize("screen_class", [MainMenu, AlgorithmSelectionScreen])
+    def test_menu_backdrop_rendered_once(self, screen_class):
+        """Test that menu gradients and titles are built once and reused."""
+        screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        menu = screen_class(WINDOW_WIDTH, WINDOW_HEIGHT)
+
+        menu.draw(screen)
+        page = menu._page
+        menu.draw(screen)
+
+        assert menu._page is page, "Cached backdrop should be reused between frames"
+        assert screen.get_at((5, 0))[:3] == (15, 25, 45), "Gradient should start dark blue"
+
+
+class TestGlyphAtlas:
+    """Tests for the glyph atlas used by tooltips and HUD labels."""
+
+    def test_width_matches_sum_of_advances(self):
+        """Test that text width is the sum of cached glyph advances."""
+        font = pygame.font.SysFont('Arial', 17)
+        atlas = GlyphAtlas(font, TOOLTIP_TEXT)
+
+        text = "Path Cost: 12.5"
+        assert atlas.width(text) == sum(font.size(c)[0] for c in text)
+
+    def test_unknown_glyph_loaded_on_demand(self):
+        """Test that characters outside the preloaded set are cached lazily."""
+        atlas = GlyphAtlas(pygame.font.SysFont('Arial', 17), TOOLTIP_TEXT)
+
+        assert '→' not in atlas.glyphs
+        atlas.draw_text(pygame.Surface((100, 30)), 'N1 → N2', (0, 0))
+        assert '→' in atlas.glyphs
+
+    def test_draw_text_renders_pixels(self):
+        """Test that drawing text changes the target surface."""
+        surface = pygame.Surface((100, 30))
+        surface.fill((255, 255, 255))
+        atlas = GlyphAtlas(pygame.font.SysFont('Arial', 17), (0, 0, 0))
+
+        atlas.draw_text(surface, 'Node N1', (2, 2))
+
+        pixels = {surface.get_at((x, y))[:3] for x in range(100) for y in range(30)}
+        assert len(pixels) > 1, "Text should be drawn onto the surface"
+
+
+class TestDirtyRects:
+    """Tests for dirty-rect tracking in GraphRenderer."""
+
+    def test_dynamic_elements_mark_dirty_rects(self):
+        """Test that moving elements and the tooltip report their screen areas."""
+        screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        session = GameSession('BFS')
+        renderer = GraphRenderer(screen, 'BFS')
+
+        renderer.draw_background()
+        assert renderer.dirty_rects == [], "New frame should start with no dirty rects"
+
+        renderer.draw_nodes(session.graph, session.player, session.enemy)
+        player_pos = tuple(int(p) for p in session.player.visual_pos)
+        assert any(rect.collidepoint(player_pos) for rect in renderer.dirty_rects)
+
+        renderer.set_tooltip(session.graph.nodes[0], (100, 100))
+        tooltip_rect = renderer.draw_tooltip()
+        assert tooltip_rect in renderer.dirty_rects
+
+    def test_no_tooltip_returns_none(self):
+        """Test that no rect is reported when no tooltip is drawn."""
+        renderer = GraphRenderer(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)), 'BFS')
+
+        renderer.draw_background()
+        assert renderer.draw_tooltip() is None
+        assert renderer.dirty_rects == []
+
+
+class TestTooltipCache:
+    """Tests for the composed tooltip surface cache."""
+
+    def test_same_lines_reuse_surface(self):
+        """Test that hovering the same node reuses the composed tooltip."""
+        screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        session = GameSession('UCS')
+        renderer = GraphRenderer(screen, 'UCS')
+        node = session.graph.nodes[0]
+
+        renderer.set_tooltip(node, (100, 100))
+        first = renderer.draw_tooltip()
+        renderer.set_tooltip(node, (150, 120))
+        second = renderer.draw_tooltip()
+
+        info = renderer._compose_tooltip.cache_info()
+        assert info.misses == 1 and info.hits == 1
+        assert first.size == second.size, "Same lines should give the same tooltip size"
+
+    def test_lines_rebuilt_when_visited_changes(self):
+        """Test that tooltip text is rebuilt only when the node or its visited flag changes."""
+        screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        session = GameSession('BFS')
+        renderer = GraphRenderer(screen, 'BFS')
+        node = session.graph.nodes[0]
+        node.visited = False
+
+        renderer.set_tooltip(node, (100, 100))
+        renderer.draw_tooltip()
+        lines = renderer._tooltip_lines
+        renderer.draw_tooltip()
+        assert renderer._tooltip_lines is lines, "Unchanged node should reuse its lines"
+
+        node.visited = True
+        renderer.draw_tooltip()
+        assert "Visited: Yes" in renderer._tooltip_lines
+
+
+class TestButtonLabelCache:
+    """Tests for cached button labels."""
+
+    def test_label_rendered_once_per_text(self):
+        """Test that the label is only re-rendered when its text changes."""
+        screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        font = pygame.font.SysFont('Arial', 16)
+        button = Button(10, 10, 180, 50, 'BACK TO MENU')
+
+        button.draw(screen, font)
+        label = button._label_surface
+        button.is_hovered = True
+        button.draw(screen, font)
+        assert button._label_surface is label, "Hover should not re-render the label"
+
+        button.text = 'RETRY - BFS'
+        button.draw(screen, font)
+        assert button._label_surface is not label, "New text should be rendered"
+
+    def test_face_rendered_once_per_state(self):
+        """Test that each hover/press state of the button is rendered once."""
+        screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        font = pygame.font.SysFont('Arial', 16)
+        button = Button(10, 10, 180, 50, 'MAIN MENU')
+
+        button.draw(screen, font)
+        normal = button._get_face(screen, font)
+        button.is_hovered = True
+        button.draw(screen, font)
+        hovered = button._get_face(screen, font)
+        button.is_hovered = False
+        button.draw(screen, font)
+
+        assert hovered is not normal
+        assert button._get_face(screen, font) is normal
+        assert len(button._faces) == 2
+
+        button.text = 'RETRY - BFS'
+        button.draw(screen, font)
+        assert button._get_face(screen, font) is not normal, "New text should clear the faces"
+
+    def test_radio_label_rendered_once(self):
+        """Test that radio button labels survive hover and selection changes."""
+        screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        font = pygame.font.SysFont('Arial', 16)
+        radio = RadioButton(100, 100, 'BFS', 'Breadth First Search')
+
+        radio.draw(screen, font, (150, 150, 200))
+        label = radio._label_surface
+        radio.hover = True
+        radio.selected = True
+        radio.draw(screen, font, (150, 150, 200))
+
+        assert radio._label_surface is label
+
+
+class TestStaticLabels:
+    """Tests for pre-rendered fixed labels."""
+
+    def test_labels_rendered_once(self):
+        """Test that node and HUD labels are reused across frames."""
+        screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        session = GameSession('DFS')
+        renderer = GraphRenderer(screen, 'DFS')
+
+        for _ in range(2):
+            renderer.draw_background()
+            renderer.draw_edges(session.graph, session.enemy.path)
+            renderer.draw_nodes(session.graph, session.player, session.enemy)
+            renderer.draw_ui_panel(session.enemy.stats, True, 0)
+            cached = dict(renderer._label_cache)
+
+        assert renderer._label_cache == cached, "Second frame should not render new labels"
+        label = renderer._label(session.graph.nodes[0].label, renderer.font, (0, 0, 0))
+        assert cached[(session.graph.nodes[0].label, renderer.font, (0, 0, 0))] is label
+
+    def test_health_bar_rendered_once_per_value(self):
+        """Test that the health bar is only rendered again when HP changes."""
+        session = GameSession('BFS')
+        renderer = GraphRenderer(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)), 'BFS')
+
+        renderer.draw_health_bars(session.player, session.enemy, 1.0, 1.0)
+        bar = renderer._label_cache[('health', 1.0)]
+        renderer.draw_health_bars(session.player, session.enemy, 1.0, 1.0)
+        assert renderer._label_cache[('health', 1.0)] is bar
+
+        renderer.draw_health_bars(session.player, session.enemy, 0.9, 1.0)
+        assert ('health', 0.9) in renderer._label_cache
+
+    def test_glow_and_overlay_built_once(self):
+        """Test that agent glow rings and the end-screen overlay are reused."""
+        session = GameSession('BFS')
+        renderer = GraphRenderer(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)), 'BFS')
+
+        renderer.draw_nodes(session.graph, session.player, session.enemy)
+        glow = renderer._glow_layers(renderer.theme['player'])
+        renderer.draw_nodes(session.graph, session.player, session.enemy)
+        assert renderer._glow_layers(renderer.theme['player']) is glow
+        assert [radius for radius, _ in glow] == [NODE_RADIUS + 15, NODE_RADIUS + 10, NODE_RADIUS + 5]
+
+        renderer.draw_defeat_screen({}, {}, 0)
+        overlay = renderer._label_cache['overlay']
+        renderer.draw_victory_screen({}, {}, 0)
+        assert renderer._label_cache['overlay'] is overlay
+
+
+class TestWorldLayer:
+    """Tests for the cached background/edge/node layer."""
+
+    def _draw_direct(self, renderer, session):
+        renderer.draw_background()
+        renderer.draw_edges(session.graph, session.enemy.path)
+        renderer.draw_nodes(session.graph, session.player, session.enemy)
+
+    def test_matches_direct_drawing(self):
+        """Test that the cached layer gives the same frame as drawing directly."""
+        session = GameSession('A* (Local Min)')
+        direct = GraphRenderer(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)), session.algorithm)
+        cached = GraphRenderer(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)), session.algorithm)
+
+        self._draw_direct(direct, session)
+        cached.draw_world(session.graph, session.enemy.path, session.player, session.enemy)
+
+        assert pygame.image.tobytes(direct.screen, 'RGB') == pygame.image.tobytes(cached.screen, 'RGB')
+        assert direct.dirty_rects == cached.dirty_rects
+
+    def test_layer_rebuilt_only_on_change(self):
+        """Test that the layer is reused until a visited flag changes."""
+        session = GameSession('BFS')
+        renderer = GraphRenderer(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)), 'BFS')
+        node = next(n for n in session.graph.nodes if not n.visited)
+
+        renderer.draw_world(session.graph, session.enemy.path, session.player, session.enemy)
+        key = renderer._world_key
+        renderer.draw_world(session.graph, session.enemy.path, session.player, session.enemy)
+        assert renderer._world_key is key, "Unchanged graph should reuse the layer"
+
+        node.visited = True
+        renderer.draw_world(session.graph, session.enemy.path, session.player, session.enemy)
+        assert renderer._world_key != key
+        inside = (int(node.pos[0]) - NODE_RADIUS + 5, int(node.pos[1]))
+        assert renderer._world_layer.get_at(inside)[:3] == renderer.theme['node_visited']
+
+
+class TestRendererReset:
+    """Tests for reusing a renderer across retries."""
+
+    def test_reset_keeps_caches_and_clears_session_state(self):
+        """Test that reset drops per-session state but keeps rendered labels."""
+        session = GameSession('UCS')
+        renderer = GraphRenderer(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)), 'UCS')
+        renderer.draw_world(session.graph, session.enemy.path, session.player, session.enemy)
+        renderer.set_tooltip(session.graph.nodes[0], (100, 100))
+        labels = dict(renderer._label_cache)
+
+        retry = GameSession('UCS', session.sound_manager)
+        renderer.reset('UCS')
+
+        assert retry.sound_manager is session.sound_manager
+        assert renderer.tooltip_node is None
+        assert renderer._world_key is None
+        assert renderer._label_cache == labels
+
+        renderer.reset('DFS')
+        assert renderer.theme == THEMES['DFS']
@@ -3,6 +3,7 @@ import pytest
 import pygame
 from unittest.mock import Mock, patch, MagicMock
 from core.sound_manager import SoundManager
+from core import gameplay
 
 
 class TestSoundManager:
@@ -104,13 +105,10 @@ class TestSoundIntegration:
     
     def test_gameplay_imports_sound_manager(self):
         """Test that gameplay.py imports SoundManager."""
-        from core.gameplay import GameSession
-        # Just verify import doesn't crash
-        assert True
+        assert gameplay.SoundManager is SoundManager
     
     def test_game_session_has_sound_manager(self):
         """Test that GameSession initializes a SoundManager."""
         # This test would require mocking pygame display and other components
         # For now, just verify the class can be imported
-        from core.gameplay import GameSession
-        assert hasattr(GameSession, '__init__')
+        assert hasattr(gameplay.GameSession, '__init__')
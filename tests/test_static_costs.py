@@ -17,7 +17,6 @@ class TestStaticCosts:
     
     def test_nodes_have_static_heuristic_and_path_cost(self):
         """Test that all nodes have static heuristic and path_cost attributes."""
-        pygame.init()
         
         graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, NUM_NODES, GRAPH_SEED)
         
@@ -36,7 +35,6 @@ class TestStaticCosts:
     
     def test_static_costs_remain_constant_during_game(self):
         """Test that static costs do not change during gameplay."""
-        pygame.init()
         
         for algo in ['BFS', 'DFS', 'UCS', 'Greedy (Local Min)', 'A* (Local Min)']:
             session = GameSession(algo)
@@ -69,7 +67,6 @@ class TestStaticCosts:
     
     def test_static_costs_different_across_graphs(self):
         """Test that different graph instances have different random costs."""
-        pygame.init()
         
         # Create two graphs with different seeds
         graph1 = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, NUM_NODES, seed=42)
@@ -96,7 +93,6 @@ class TestStaticCosts:
     
     def test_static_costs_same_for_same_seed(self):
         """Test that graphs with the same seed have the same static costs."""
-        pygame.init()
         
         # Create two graphs with the same seed
         graph1 = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, NUM_NODES, seed=42)
@@ -118,7 +114,6 @@ class TestStaticCosts:
         Note: After implementing game balance fixes, costs are now assigned based
         on spawn positions to create ~50% enemy-favorable games. This is intentional.
         """
-        pygame.init()
         
         # Create multiple game sessions (random player spawns)
         sessions = [GameSession('A* (Local Min)') for _ in range(3)]
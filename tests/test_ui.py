@@ -0,0 +1,43 @@
+"""Tests for keyboard input handling."""
+import pytest
+import pygame
+from core.ui import UIHandler, UIState
+
+
+class TestUIHandler:
+    """Tests for UIHandler keypress processing."""
+    
+    def test_number_keys_select_algorithm(self):
+        """Test that keys 1-5 map to algorithm selections."""
+        handler = UIHandler()
+        
+        for key, expected in [(pygame.K_1, '1'), (pygame.K_3, '3'), (pygame.K_5, '5')]:
+            state = handler.handle_keypress(key)
+            assert state.algo_key == expected
+            assert state.paused is None
+            assert not state.map_switch
+    
+    def test_space_toggles_pause(self):
+        """Test that SPACE toggles pause state."""
+        handler = UIHandler()
+        
+        assert handler.handle_keypress(pygame.K_SPACE).paused is True
+        assert handler.handle_keypress(pygame.K_SPACE).paused is False
+    
+    def test_map_switch_and_unknown_keys(self):
+        """Test map switch key and that other keys change nothing."""
+        handler = UIHandler()
+        
+        assert handler.handle_keypress(pygame.K_m).map_switch
+        assert handler.handle_keypress(pygame.K_z) == UIState()
+    
+    def test_ui_state_has_no_instance_dict(self):
+        """Test that UIState uses slots (created on every keypress)."""
+        state = UIState()
+        assert not hasattr(state, '__dict__')
+        with pytest.raises(AttributeError):
+            state.unknown_field = True
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -13,14 +13,17 @@ from core.graphics import GraphRenderer
 from config import *
 
 
+@pytest.fixture(scope="module")
+def screen():
+    """Off-screen surface for the renderers to draw to."""
+    return pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+
 class TestVisualBugFixes:
     """Test suite for the 3 critical visual bug fixes."""
     
-    def test_bug_fix_1_dynamic_info_box_sizing(self):
+    def test_bug_fix_1_dynamic_info_box_sizing(self, screen):
         """Test that info box dynamically sizes to fit algorithm names."""
-        pygame.init()
-        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-        
         # Test with algorithms that have long names
         long_algorithms = ['Greedy (Local Min)', 'Greedy (Local Max)', 'A* (Local Min)', 'A* (Local Max)']
         
@@ -41,8 +44,6 @@ class TestVisualBugFixes:
     
     def test_bug_fix_2_tooltips_show_numeric_heuristics(self):
         """Test that tooltips show numeric values instead of 'Not calculated'."""
-        pygame.init()
-        
         for algo in ['Greedy (Local Min)', 'Greedy (Local Max)', 'A* (Local Min)', 'A* (Local Max)']:
             session = GameSession(algo)
             
@@ -64,8 +65,6 @@ class TestVisualBugFixes:
     
     def test_bug_fix_2_heuristics_update_on_player_move(self):
         """Test that heuristics update when player moves."""
-        pygame.init()
-        
         session = GameSession('Greedy (Local Min)')
         
         # Store player's initial node
@@ -92,8 +91,6 @@ class TestVisualBugFixes:
     
     def test_bug_fix_3_nodes_have_fixed_positions(self):
         """Test that nodes maintain fixed positions during gameplay."""
-        pygame.init()
-        
         session = GameSession('BFS')
         graph = session.graph
         
@@ -119,8 +116,6 @@ class TestVisualBugFixes:
     
     def test_bug_fix_3_visual_pos_independent_of_node_pos(self):
         """Test that player/enemy visual_pos is independent of node.pos."""
-        pygame.init()
-        
         session = GameSession('DFS')
         player = session.player
         enemy = session.enemy
@@ -143,8 +138,6 @@ class TestVisualBugFixes:
     
     def test_graph_update_heuristics_method_exists(self):
         """Test that Graph has the update_heuristics_to_target method."""
-        pygame.init()
-        
         graph = Graph(WINDOW_WIDTH, WINDOW_HEIGHT, NUM_NODES, GRAPH_SEED)
         
         # Check method exists
@@ -161,12 +154,10 @@ class TestVisualBugFixes:
         for node in graph.nodes:
             if node != target_node:
                 expected_heuristic = node.distance_to(target_node)
-                assert abs(node.h_cost - expected_heuristic) < 0.01, f"Node {node.label} h_cost should match distance"
+                assert node.h_cost == pytest.approx(expected_heuristic, abs=0.01), f"Node {node.label} h_cost should match distance"
     
     def test_game_session_tracks_player_movement_for_heuristics(self):
         """Test that GameSession initializes player_last_node for tracking."""
-        pygame.init()
-        
         session = GameSession('A* (Local Min)')
         
         # Should have player_last_node attribute
@@ -4,6 +4,7 @@ from core.node import Node
 from core.graph import Graph
 from core.gameplay import GameSession
 from algorithms.graph_algorithms import find_path
+from tests.helpers import MockGraph
 
 
 class TestWinningConditions:
@@ -21,15 +22,7 @@ class TestWinningConditions:
         node2.add_neighbor(node3, 5)  # node3 is a leaf
         node1.add_neighbor(node4, 5)
         
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1, node2, node3, node4]
-            
-            def reset_all_nodes(self):
-                for node in self.nodes:
-                    node.reset_pathfinding()
-        
-        graph = MockGraph()
+        graph = MockGraph([node1, node2, node3, node4])
         visited_leaves = set()
         
         # Enemy searches for node3 (leaf) from node1
@@ -56,15 +49,7 @@ class TestWinningConditions:
         node2.add_neighbor(node3, 5)
         node2.add_neighbor(node4, 5)
         
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1, node2, node3, node4]
-            
-            def reset_all_nodes(self):
-                for node in self.nodes:
-                    node.reset_pathfinding()
-        
-        graph = MockGraph()
+        graph = MockGraph([node1, node2, node3, node4])
         
         # Greedy should not backtrack
         path, stats = find_path('Greedy (Local Min)', graph, node1, node4)
@@ -80,8 +65,6 @@ class TestWinningConditions:
         """Test that GameSession detects victory when enemy has no path."""
         # This is tested indirectly - the victory condition is in gameplay.py
         # We verify it exists and is correct
-        from core.gameplay import GameSession
-        
         # Create a game session
         session = GameSession('BFS')
         
@@ -98,15 +81,7 @@ class TestWinningConditions:
         node1 = Node("N1", (100, 100))
         node2 = Node("N2", (300, 300))  # No connection
         
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1, node2]
-            
-            def reset_all_nodes(self):
-                for node in self.nodes:
-                    node.reset_pathfinding()
-        
-        graph = MockGraph()
+        graph = MockGraph([node1, node2])
         
         algorithms = [
             'BFS', 'DFS', 'UCS',
@@ -131,15 +106,7 @@ class TestBFSDFSUCSLeafTracking:
         node1.add_neighbor(node2, 5)
         node2.add_neighbor(node3, 5)
         
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1, node2, node3]
-            
-            def reset_all_nodes(self):
-                for node in self.nodes:
-                    node.reset_pathfinding()
-        
-        graph = MockGraph()
+        graph = MockGraph([node1, node2, node3])
         visited_leaves = set()
         
         path, stats = find_path('DFS', graph, node1, node3, visited_leaves)
@@ -155,15 +122,7 @@ class TestBFSDFSUCSLeafTracking:
         node1.add_neighbor(node2, 5)
         node2.add_neighbor(node3, 5)
         
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1, node2, node3]
-            
-            def reset_all_nodes(self):
-                for node in self.nodes:
-                    node.reset_pathfinding()
-        
-        graph = MockGraph()
+        graph = MockGraph([node1, node2, node3])
         visited_leaves = set()
         
         path, stats = find_path('UCS', graph, node1, node3, visited_leaves)
@@ -180,15 +139,7 @@ class TestBFSDFSUCSLeafTracking:
         node2.add_neighbor(node3, 5)
         node1.add_neighbor(node3, 5)  # node2 and node3 now have 2 neighbors
         
-        class MockGraph:
-            def __init__(self):
-                self.nodes = [node1, node2, node3]
-            
-            def reset_all_nodes(self):
-                for node in self.nodes:
-                    node.reset_pathfinding()
-        
-        graph = MockGraph()
+        graph = MockGraph([node1, node2, node3])
         visited_leaves = set()
         
         # None of these are leaves (all have 2 neighbors)